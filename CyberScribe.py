@@ -10,7 +10,9 @@
 #    python CyberScribe.py
 #
 # 3. COMPILATION EN .EXE (Mode Autonome)
-#    pyinstaller --noconsole --onefile --noconfirm --icon="app.ico" --hidden-import=pyaudio --hidden-import=pynput.keyboard._win32 --hidden-import=pynput.mouse._win32 --add-data "<venv>/Lib/site-packages/faster_whisper/assets;faster_whisper/assets" --name "CyberScribe" CyberScribe.py
+#    Les dépendances sont importées à la demande (_LazyModule) : PyInstaller ne
+#    les voit pas, chacune doit donc figurer dans un --hidden-import.
+#    pyinstaller --noconsole --onefile --noconfirm --icon="app.ico" --hidden-import=pyaudio --hidden-import=pystray --hidden-import=pyperclip --hidden-import=pyautogui --hidden-import=pynput.keyboard --hidden-import=PIL.Image --hidden-import=numpy --hidden-import=faster_whisper --hidden-import=ctranslate2 --hidden-import=tkinter --hidden-import=tkinter.ttk --hidden-import=tkinter.messagebox --hidden-import=pynput.keyboard._win32 --hidden-import=pynput.mouse._win32 --add-data "<venv>/Lib/site-packages/faster_whisper/assets;faster_whisper/assets" --name "CyberScribe" CyberScribe.py
 #
 # ==================================================================================
 """
@@ -20,21 +22,32 @@ import os
 import time
 import json
 import threading
-import subprocess
 import wave
 import tempfile
 import base64
 import queue
+import collections
+import dataclasses
 import logging
+import logging.handlers
+import atexit
 import glob
+import mmap
+import struct
 import ctypes
+import importlib
+import importlib.util
+import importlib.metadata
+import platform
 from io import BytesIO
-import tkinter as tk
-from tkinter import ttk, messagebox
+
+_MODULE_STARTED = time.perf_counter()
 
 __version__ = "1.2.0"
 APP_MUTEX_NAME = "Global\\CyberScribeSingleInstance"
 ERROR_ALREADY_EXISTS = 183
+# Virtual Tk event that wakes the main loop when CyberScribeApp.post() queues work
+WAKE_EVENT = "<<CyberScribeWake>>"
 
 # Application directory (works for both script and PyInstaller .exe)
 if getattr(sys, "frozen", False):
@@ -45,18 +58,30 @@ else:
 MODELS_DIR = os.path.join(APP_DIR, "models")
 os.makedirs(MODELS_DIR, exist_ok=True)
 
+# Opt-in WAV dumps of captured audio (debug only, see "debug_dump_wav")
+DEBUG_AUDIO_DIR = os.path.join(APP_DIR, "debug_audio")
+
 # Configure Logging (privacy-conscious: no transcription content logged)
 LOG_FILE = os.path.join(APP_DIR, "debug_CyberScribe.log")
-MAX_LOG_SIZE = 1 * 1024 * 1024  # 1 MB
+MAX_LOG_SIZE = 1 * 1024 * 1024  # 1 MB per file
+LOG_BACKUPS = 3  # debug_CyberScribe.log.1 .. .3 (default for "log_backups")
+VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR"}
 
 VALID_LANGUAGES = {
     "auto", "en", "fr", "de", "es", "it", "ja", "zh", "nl", "uk", "pt", "ru",
 }
 VALID_MODELS = {"tiny", "base", "small", "medium", "large-v3"}
 VALID_DEVICES = {"auto", "cpu", "cuda"}
-VALID_COMPUTE = {"int8", "int8_float16", "float16", "float32"}
-VALID_PROFILES = {"fast", "balanced", "accurate"}
+VALID_COMPUTE = {"auto", "int8", "int8_float16", "float16", "float32"}
+VALID_PROFILES = {"fast", "balanced", "accurate", "auto"}
+VALID_INJECTION_MODES = {"auto", "paste", "type"}
+VALID_CAPTURE_BACKENDS = {"memory", "spill"}
 MAX_RECORD_SECONDS_CAP = 600
+# With "chunked_recording" audio is decoded and released while capturing, so
+# the cap can be much higher: memory is bounded by CHUNK_BUFFER_SECONDS.
+LONG_RECORD_SECONDS_CAP = 4 * 3600
+CHUNK_BUFFER_SECONDS = 120
+SAMPLE_RATE = 16000  # Whisper's native rate; capture runs at it directly
 
 
 def _safe_print(msg):
@@ -76,38 +101,36 @@ def _message_box(title, msg, flags=0x10):
         _safe_print(f"{title}: {msg}")
 
 
-def _rotate_log():
-    """Purge log file if it exceeds MAX_LOG_SIZE."""
-    try:
-        if os.path.exists(LOG_FILE) and os.path.getsize(LOG_FILE) > MAX_LOG_SIZE:
-            os.remove(LOG_FILE)
-    except Exception:
-        pass
-
-
-_rotate_log()
+def _setup_logging():
+    """Log through a queue so callers never wait on file I/O or rotation.
 
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
+    Records are formatted and written by a QueueListener thread into a
+    RotatingFileHandler; the file is only created on the first record.
+    """
+    file_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE, maxBytes=MAX_LOG_SIZE, backupCount=LOG_BACKUPS, encoding="utf-8", delay=True
+    )
+    file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, file_handler)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(records))
+    listener.start()
+    atexit.register(listener.stop)  # drains the queue before exit
+    return file_handler
 
 
-def _cleanup_orphan_temp_wav():
-    """Remove leftover CyberScribe wav files from previous runs."""
-    try:
-        temp_dir = tempfile.gettempdir()
-        for path in glob.glob(os.path.join(temp_dir, "cyberscribe_*.wav")):
-            try:
-                os.remove(path)
-            except Exception:
-                pass
-    except Exception:
-        pass
+LOG_HANDLER = _setup_logging()
 
 
-_cleanup_orphan_temp_wav()
+def apply_log_settings(config):
+    """Apply "log_level" and "log_backups" at runtime."""
+    level = config.get("log_level") or "INFO"
+    logging.getLogger().setLevel(getattr(logging, level, logging.INFO))
+    backups = config.get("log_backups")
+    if backups is not None:
+        LOG_HANDLER.backupCount = backups
 
 
 def log(msg):
@@ -134,21 +157,92 @@ def _acquire_single_instance():
         return True
 
 
-# Third-party imports
-try:
-    import pyaudio
-    import pystray
-    import pyperclip
-    import pyautogui
-    from pynput import keyboard
-    from PIL import Image
-    from faster_whisper import WhisperModel
-except ImportError as e:
-    _message_box(
-        "Erreur CyberScribe",
-        f"Erreur critique - Dépendance manquante :\n{e}\n\nL'application va fermer.",
-    )
-    sys.exit(1)
+class StartupTimer:
+    """Cold-start stage timings, logged as a single report line."""
+
+    def __init__(self, started):
+        self.started = started
+        self.stages = {}
+        self.reported = False
+        self._lock = threading.Lock()
+
+    def add(self, stage, seconds):
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def milestone(self, stage):
+        """Record ``stage`` as seconds since the module started importing."""
+        elapsed = time.perf_counter() - self.started
+        with self._lock:
+            self.stages.setdefault(stage, elapsed)
+        return elapsed
+
+    def report(self):
+        with self._lock:
+            if self.reported:
+                return
+            self.reported = True
+            parts = ", ".join(f"{k} {v:.3f}s" for k, v in self.stages.items())
+        log(f"Startup timings: {parts}")
+
+
+STARTUP = StartupTimer(_MODULE_STARTED)
+STARTUP_BUDGET_SECONDS = 1.0  # splash + tray on screen
+
+
+class _LazyModule:
+    """Module proxy that imports on first attribute access.
+
+    Keeps heavy dependencies off the startup path: each one is loaded by the
+    thread that first needs it.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            started = time.perf_counter()
+            module = importlib.import_module(self._name)
+            if self._module is None:
+                self._module = module
+                STARTUP.add(f"import {self._name}", time.perf_counter() - started)
+        return getattr(self._module, attr)
+
+
+# Third-party imports (deferred, see _LazyModule). PyInstaller can't see these,
+# so each one is also a --hidden-import in build.yml and the header above.
+pyaudio = _LazyModule("pyaudio")
+pystray = _LazyModule("pystray")
+pyperclip = _LazyModule("pyperclip")
+pyautogui = _LazyModule("pyautogui")
+keyboard = _LazyModule("pynput.keyboard")
+Image = _LazyModule("PIL.Image")
+np = _LazyModule("numpy")
+faster_whisper = _LazyModule("faster_whisper")
+ctranslate2 = _LazyModule("ctranslate2")  # installed with faster_whisper
+# Tk too: the headless modes (transcribe, serve, client) never load it.
+tk = _LazyModule("tkinter")
+ttk = _LazyModule("tkinter.ttk")
+messagebox = _LazyModule("tkinter.messagebox")
+
+REQUIRED_PACKAGES = (
+    "pyaudio", "pystray", "pyperclip", "pyautogui", "pynput", "PIL", "numpy", "faster_whisper",
+    "tkinter",
+)
+
+
+def _check_dependencies(packages=REQUIRED_PACKAGES):
+    """Fail fast on a missing package without paying for importing it."""
+    missing = [name for name in packages if importlib.util.find_spec(name) is None]
+    if missing:
+        _message_box(
+            "Erreur CyberScribe",
+            "Erreur critique - Dépendance manquante :\n"
+            f"{', '.join(missing)}\n\nL'application va fermer.",
+        )
+        sys.exit(1)
 
 # ==================================================================================
 # ASSETS (BASE64)
@@ -247,9 +341,42 @@ DEFAULT_CONFIG = {
     "language": "fr",
     "model_size": "base",
     "device": "auto",
-    "compute_type": "int8",
+    "compute_type": "auto",
     "transcription_profile": "fast",
     "max_record_seconds": 25,
+    "debug_dump_wav": False,
+    "streaming": False,
+    "chunked_recording": False,
+    "capture_backend": "memory",
+    "language_candidates": (),
+    "language_min_probability": 0.8,
+    "language_redetect_logprob": -1.0,
+    "cascade_enabled": False,
+    "cascade_model": "small",
+    "cascade_logprob": -0.8,
+    "cascade_compression_ratio": 2.4,
+    "cascade_no_speech": 0.6,
+    "silence_trim": True,
+    "silence_gate_dbfs": -50.0,
+    "max_queue_depth": 3,
+    "model_cache_mb": 2048,
+    "server_enabled": False,
+    "server_port": 8765,
+    "server_max_concurrent": 1,
+    "server_max_waiting": 4,
+    "latency_target_ms": 1500,
+    "adaptive_decoding": True,
+    "short_clip_seconds": 4,
+    "long_clip_seconds": 30,
+    "cpu_threads": 0,
+    "num_workers": 1,
+    "max_concurrent_transcriptions": 1,
+    "reserved_cores": 0,
+    "injection_mode": "auto",
+    "type_max_chars": 32,
+    "restore_clipboard": True,
+    "log_level": "INFO",
+    "log_backups": LOG_BACKUPS,
 }
 ALLOWED_KEYS = set(DEFAULT_CONFIG.keys())
 
@@ -283,6 +410,17 @@ PROFILE_PRESETS = {
     },
 }
 
+# "auto" profile: the real decode speed (RTF) of each preset is learnt from
+# dictations per (model, device, compute_type, threads) and the most
+# accurate preset that fits latency_target_ms is used. Measurements persist
+# next to config.json.
+CALIBRATION_FILE = os.path.join(APP_DIR, "calibration.json")
+_calibration_lock = threading.Lock()
+CALIBRATION_CLIP_SECONDS = 10  # a typical dictation; the target applies to it
+CALIBRATION_MIN_CLIP_SECONDS = 5  # shorter clips are dominated by the 30s window padding
+CALIBRATION_MIN_DICTATIONS = 3  # before trying the next more accurate preset
+PROFILE_QUALITY_ORDER = ("accurate", "balanced", "fast")
+
 HOTKEY_MODIFIERS = {
     "ctrl": "<ctrl>",
     "control": "<ctrl>",
@@ -328,65 +466,180 @@ def sanitize_config(data):
     language = str(cfg.get("language") or "fr").lower()
     cfg["language"] = language if language in VALID_LANGUAGES else "fr"
 
+    candidates = cfg.get("language_candidates")
+    if not isinstance(candidates, (list, tuple)):
+        candidates = ()
+    candidates = [str(code).lower() for code in candidates]
+    cfg["language_candidates"] = tuple(
+        code for code in dict.fromkeys(candidates) if code in VALID_LANGUAGES and code != "auto"
+    )
+    for key, low, high in (
+        ("language_min_probability", 0.0, 1.0),
+        ("language_redetect_logprob", -5.0, 0.0),
+        ("cascade_logprob", -5.0, 0.0),
+        ("cascade_compression_ratio", 1.0, 10.0),
+        ("cascade_no_speech", 0.0, 1.0),
+        ("silence_gate_dbfs", -90.0, -20.0),
+    ):
+        try:
+            value = float(cfg.get(key))
+        except (TypeError, ValueError):
+            value = DEFAULT_CONFIG[key]
+        cfg[key] = max(low, min(value, high))
+
     model_size = str(cfg.get("model_size") or "base").lower()
     cfg["model_size"] = model_size if model_size in VALID_MODELS else "base"
 
+    cfg["cascade_enabled"] = bool(cfg.get("cascade_enabled"))
+    cascade_model = str(cfg.get("cascade_model") or "small").lower()
+    cfg["cascade_model"] = cascade_model if cascade_model in VALID_MODELS else "small"
+
     device = str(cfg.get("device") or "auto").lower()
     cfg["device"] = device if device in VALID_DEVICES else "auto"
 
-    compute_type = str(cfg.get("compute_type") or "int8").lower()
-    cfg["compute_type"] = compute_type if compute_type in VALID_COMPUTE else "int8"
+    compute_type = str(cfg.get("compute_type") or "auto").lower()
+    cfg["compute_type"] = compute_type if compute_type in VALID_COMPUTE else "auto"
 
     profile = str(cfg.get("transcription_profile") or "fast").lower()
     cfg["transcription_profile"] = profile if profile in VALID_PROFILES else "fast"
 
+    cfg["chunked_recording"] = bool(cfg.get("chunked_recording"))
     try:
         max_seconds = int(cfg.get("max_record_seconds"))
     except (TypeError, ValueError):
         max_seconds = DEFAULT_CONFIG["max_record_seconds"]
-    cfg["max_record_seconds"] = max(0, min(max_seconds, MAX_RECORD_SECONDS_CAP))
-    return cfg
+    cap = LONG_RECORD_SECONDS_CAP if cfg["chunked_recording"] else MAX_RECORD_SECONDS_CAP
+    cfg["max_record_seconds"] = max(0, min(max_seconds, cap))
 
+    cfg["debug_dump_wav"] = bool(cfg.get("debug_dump_wav"))
+    cfg["streaming"] = bool(cfg.get("streaming"))
+    cfg["silence_trim"] = bool(cfg.get("silence_trim"))
 
-def detect_nvidia_gpu():
-    """Best-effort NVIDIA detection without hard dependency on torch."""
     try:
-        result = subprocess.run(
-            ["nvidia-smi", "-L"],
-            capture_output=True,
-            text=True,
-            timeout=2,
-            check=False,
-        )
-        return result.returncode == 0 and "GPU" in result.stdout
-    except Exception:
-        return False
+        depth = int(cfg.get("max_queue_depth"))
+    except (TypeError, ValueError):
+        depth = DEFAULT_CONFIG["max_queue_depth"]
+    cfg["max_queue_depth"] = max(1, min(depth, 10))
+
+    try:
+        cache_mb = int(cfg.get("model_cache_mb"))
+    except (TypeError, ValueError):
+        cache_mb = DEFAULT_CONFIG["model_cache_mb"]
+    cfg["model_cache_mb"] = max(0, min(cache_mb, 65536))
+
+    cfg["server_enabled"] = bool(cfg.get("server_enabled"))
+    cfg["adaptive_decoding"] = bool(cfg.get("adaptive_decoding"))
+    cfg["restore_clipboard"] = bool(cfg.get("restore_clipboard"))
+
+    backend = str(cfg.get("capture_backend") or "memory").lower()
+    cfg["capture_backend"] = backend if backend in VALID_CAPTURE_BACKENDS else "memory"
+
+    mode = str(cfg.get("injection_mode") or "auto").lower()
+    cfg["injection_mode"] = mode if mode in VALID_INJECTION_MODES else "auto"
+
+    log_level = str(cfg.get("log_level") or "INFO").upper()
+    cfg["log_level"] = log_level if log_level in VALID_LOG_LEVELS else "INFO"
+    for key, low, high in (
+        ("server_port", 1024, 65535),
+        ("server_max_concurrent", 1, 8),
+        ("server_max_waiting", 0, 64),
+        ("latency_target_ms", 200, 60000),
+        ("short_clip_seconds", 0, 30),
+        ("long_clip_seconds", 5, MAX_RECORD_SECONDS_CAP),
+        ("cpu_threads", -1, 256),
+        ("num_workers", 1, 8),
+        ("max_concurrent_transcriptions", 1, 8),
+        ("reserved_cores", 0, 64),
+        ("type_max_chars", 0, 500),
+        ("log_backups", 0, 20),
+    ):
+        try:
+            value = int(cfg.get(key))
+        except (TypeError, ValueError):
+            value = DEFAULT_CONFIG[key]
+        cfg[key] = max(low, min(value, high))
+    cfg["long_clip_seconds"] = max(cfg["long_clip_seconds"], cfg["short_clip_seconds"] + 1)
+    return cfg
+
+
+class _SnapshotAccess:
+    """dict-style reads, so a snapshot works wherever a config dict does."""
+
+    __slots__ = ()
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def as_dict(self):
+        return dataclasses.asdict(self)
+
+
+# Immutable, typed view of a sanitized config: one field per DEFAULT_CONFIG key.
+ConfigSnapshot = dataclasses.make_dataclass(
+    "ConfigSnapshot",
+    [(key, type(value), dataclasses.field(default=value)) for key, value in DEFAULT_CONFIG.items()],
+    bases=(_SnapshotAccess,),
+    frozen=True,
+)
+
+CONFIG_SAVE_DELAY = 0.5  # set()/update() bursts within this window share one write
+CONFIG_WATCH_INTERVAL = 2.0  # how often watch() looks at config.json's mtime
 
 
 class ConfigManager:
+    """config.json behind an immutable ConfigSnapshot.
+
+    Readers take ``snapshot`` (or call get()) without locking: writers build
+    a new snapshot and swap the reference. File writes are debounced, and
+    watch() reloads the file when something else edits it.
+    """
+
     def __init__(self):
-        self.config = DEFAULT_CONFIG.copy()
+        self.snapshot = ConfigSnapshot()
+        self._write_lock = threading.Lock()
+        self._save_timer = None
+        self._save_pending = False  # a local change not yet on disk
+        self._mtime = None  # config.json mtime as last written or read by us
         self.load()
+        atexit.register(self.flush)
+
+    @property
+    def config(self):
+        """Plain dict copy of the current snapshot."""
+        return self.snapshot.as_dict()
+
+    def _read_file(self):
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self._mtime = mtime
+        return ConfigSnapshot(**sanitize_config(data))
 
     def load(self):
         if os.path.exists(CONFIG_FILE):
             try:
-                with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                self.config = sanitize_config(data)
+                self.snapshot = self._read_file()
             except Exception as e:
                 log_error(f"Erreur chargement config: {e}")
-                self.config = DEFAULT_CONFIG.copy()
+                self.snapshot = ConfigSnapshot()
         else:
             self.save()
+        apply_log_settings(self.snapshot)
 
     def save(self):
-        self.config = sanitize_config(self.config)
+        """Write the current snapshot now."""
+        with self._write_lock:
+            self._write_file()
+
+    def _write_file(self):
+        """Write the snapshot; the caller holds _write_lock."""
         tmp_path = CONFIG_FILE + ".tmp"
         try:
             with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=4)
+                json.dump(self.snapshot.as_dict(), f, indent=4)
             os.replace(tmp_path, CONFIG_FILE)
+            self._mtime = os.stat(CONFIG_FILE).st_mtime_ns
+            self._save_pending = False
         except Exception as e:
             log_error(f"Erreur sauvegarde config: {e}")
             try:
@@ -395,53 +648,456 @@ class ConfigManager:
             except Exception:
                 pass
 
+    def _schedule_save(self):
+        """Arm the debounced write; the caller holds _write_lock."""
+        self._save_pending = True
+        if self._save_timer is not None:
+            return  # the pending write will pick up this change too
+        self._save_timer = threading.Timer(CONFIG_SAVE_DELAY, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def flush(self):
+        """Write now if a debounced save is pending."""
+        with self._write_lock:
+            timer, self._save_timer = self._save_timer, None
+            if timer is not None:
+                timer.cancel()
+                self._write_file()
+
     def get(self, key):
-        val = self.config.get(key)
+        val = getattr(self.snapshot, key, None)
         if val is None or val == "":
             return DEFAULT_CONFIG.get(key)
         return val
 
     def set(self, key, value):
-        self.config[key] = value
-        self.save()
+        self.update({key: value})
 
     def update(self, values):
-        self.config.update(values)
-        self.save()
+        with self._write_lock:
+            data = self.snapshot.as_dict()
+            data.update(values)
+            self.snapshot = ConfigSnapshot(**sanitize_config(data))
+            self._schedule_save()
+
+    def reload_if_changed(self):
+        """Reload config.json if it was edited externally; True when values changed.
+
+        A pending local write wins: the file is not read until it has landed.
+        """
+        with self._write_lock:
+            try:
+                mtime = os.stat(CONFIG_FILE).st_mtime_ns
+            except OSError:
+                return False
+            if mtime == self._mtime or self._save_pending:
+                return False
+            old = self.snapshot
+            try:
+                self.snapshot = self._read_file()
+            except Exception as e:
+                self._mtime = mtime  # don't retry a broken file until it changes again
+                log_error(f"Erreur rechargement config (conservée): {e}")
+                return False
+        if self.snapshot == old:
+            return False
+        log("config.json changed on disk, reloaded.")
+        apply_log_settings(self.snapshot)
+        return True
+
+    def watch(self, on_change, interval=CONFIG_WATCH_INTERVAL):
+        """Poll config.json in the background; call ``on_change()`` after a reload."""
+        def _loop():
+            while True:
+                time.sleep(interval)
+                try:
+                    if self.reload_if_changed():
+                        on_change()
+                except Exception as e:
+                    log_error(f"Config watch error: {e}")
+
+        threading.Thread(target=_loop, daemon=True).start()
 
 
 # ==================================================================================
 # AUDIO RECORDER
 # ==================================================================================
 
+def pcm16_to_float32(pcm):
+    """Convert mono int16 PCM to the float32 [-1, 1) samples Whisper expects.
+
+    The int16 view over ``pcm`` is zero-copy; the float conversion is the only
+    allocation and is scaled in place.
+    """
+    samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+    samples *= 1.0 / 32768.0
+    return samples
+
+
+# Energy gate: 30 ms frames, voiced when louder than the clip's noise floor
+# plus a margin (clamped to an absolute window), padded so word edges survive.
+# The lower end of the window is the ``silence_gate_dbfs`` setting.
+GATE_FRAME_SECONDS = 0.03
+GATE_MARGIN_DB = 8.0
+GATE_MIN_DBFS = DEFAULT_CONFIG["silence_gate_dbfs"]
+GATE_MAX_DBFS = -35.0
+GATE_PAD_SECONDS = 0.25
+GATE_MIN_SPEECH_SECONDS = 0.15
+
+
+def _frame_dbfs(samples, rate):
+    """(frame_size, dBFS of each GATE_FRAME_SECONDS frame), or None if too short."""
+    frame = int(rate * GATE_FRAME_SECONDS)
+    count = samples.size // frame
+    if count == 0:
+        return None
+    frames = samples[:count * frame].reshape(count, frame)
+    energy = np.einsum("ij,ij->i", frames, frames) / frame
+    return frame, 10.0 * np.log10(energy + 1e-12)
+
+
+def _voiced_frames(samples, rate, min_dbfs=GATE_MIN_DBFS):
+    """(frame_size, bool array of voiced GATE_FRAME_SECONDS frames), or None if too short."""
+    levels = _frame_dbfs(samples, rate)
+    if levels is None:
+        return None
+    frame, db = levels
+    floor = np.percentile(db, 10)
+    threshold = min(max(floor + GATE_MARGIN_DB, min_dbfs), max(GATE_MAX_DBFS, min_dbfs))
+    return frame, db > threshold
+
+
+def loudest_frame_dbfs(samples, rate):
+    """Level of the loudest GATE_FRAME_SECONDS frame in dBFS, or None if too short."""
+    levels = _frame_dbfs(samples, rate)
+    return None if levels is None else float(levels[1].max())
+
+
+def find_speech_bounds(samples, rate, min_dbfs=GATE_MIN_DBFS):
+    """Return (start, end) sample bounds of the voiced region, or None if silent."""
+    gated = _voiced_frames(samples, rate, min_dbfs)
+    if gated is None:
+        return None
+    frame, voiced = gated
+    voiced = np.flatnonzero(voiced)
+    if voiced.size * GATE_FRAME_SECONDS < GATE_MIN_SPEECH_SECONDS:
+        return None
+    pad = int(rate * GATE_PAD_SECONDS)
+    start = max(0, int(voiced[0]) * frame - pad)
+    end = min(samples.size, (int(voiced[-1]) + 1) * frame + pad)
+    return start, end
+
+
+def find_pause(samples, rate, min_pause, min_dbfs=GATE_MIN_DBFS):
+    """Sample index in the middle of the last pause of at least ``min_pause`` s, or None."""
+    gated = _voiced_frames(samples, rate, min_dbfs)
+    if gated is None:
+        return None
+    frame, voiced = gated
+    edges = np.diff(np.concatenate(([1], voiced.astype(np.int8), [1])))
+    starts, ends = np.flatnonzero(edges == -1), np.flatnonzero(edges == 1)
+    long_enough = (ends - starts) * GATE_FRAME_SECONDS >= min_pause
+    if not long_enough.any():
+        return None
+    last = np.flatnonzero(long_enough)[-1]
+    return int(starts[last] + ends[last]) // 2 * frame
+
+
+class PcmRingBuffer:
+    """Preallocated int16 capture buffer, written in place.
+
+    Positions are absolute sample counts since reset(). Once more than
+    ``capacity`` samples are written the oldest audio is overwritten.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = int(capacity)
+        self.samples = np.empty(self.capacity, dtype=np.int16)
+        self._raw = memoryview(self.samples).cast("B")
+        self.written = 0
+
+    def reset(self):
+        self.written = 0
+
+    def write(self, data):
+        raw = memoryview(data).cast("B")
+        n = raw.nbytes // 2
+        if n > self.capacity:
+            self.written += n - self.capacity
+            raw = raw[-self.capacity * 2:]
+            n = self.capacity
+        pos = self.written % self.capacity
+        first = min(n, self.capacity - pos)
+        self._raw[pos * 2:(pos + first) * 2] = raw[:first * 2]
+        if first < n:
+            self._raw[:(n - first) * 2] = raw[first * 2:]
+        self.written += n
+
+    def view(self, start=0):
+        """Samples from absolute position ``start`` to now, in order, as a memoryview.
+
+        Zero-copy unless the range wraps; audio already overwritten is skipped.
+        """
+        start = max(start, self.written - self.capacity, 0)
+        length = max(0, self.written - start)
+        first = start % self.capacity
+        if first + length <= self.capacity:
+            return memoryview(self.samples[first:first + length])
+        rest = first + length - self.capacity
+        return memoryview(np.concatenate((self.samples[first:], self.samples[:rest])))
+
+    def close(self):
+        pass
+
+
+# Capture spill files (see SpillRingBuffer). The header records the writer
+# and the sample count, so a file left behind by a crash can be salvaged.
+SPILL_PREFIX = "cyberscribe_spill_"
+SPILL_MAGIC = b"CSSPILL1"
+SPILL_HEADER = struct.Struct("<8sIIQ")  # magic, sample rate, pid, samples written
+SPILL_WRITTEN_OFFSET = 16
+
+
+class SpillRingBuffer(PcmRingBuffer):
+    """PcmRingBuffer backed by a memory-mapped file in the temp directory.
+
+    The file starts with SPILL_HEADER, updated on every write.
+    Captured audio lives in the page cache instead of the heap. Every
+    RELEASE_BYTES the mapped pages are dropped from the process
+    (MADV_DONTNEED keeps the data of a shared file mapping), so RSS stays
+    around a megabyte whatever the recording length. Views are still
+    zero-copy; reading faults the pages back in.
+    """
+
+    RELEASE_BYTES = 1 << 20  # ~32s of audio
+
+    def __init__(self, capacity):
+        self.capacity = int(capacity)
+        fd, self.path = tempfile.mkstemp(prefix=SPILL_PREFIX, suffix=".pcm")
+        size = SPILL_HEADER.size + self.capacity * 2
+        try:
+            os.ftruncate(fd, size)
+            self._mmap = mmap.mmap(fd, size)
+        except Exception:
+            os.close(fd)
+            os.remove(self.path)
+            raise
+        os.close(fd)
+        SPILL_HEADER.pack_into(self._mmap, 0, SPILL_MAGIC, SAMPLE_RATE, os.getpid(), 0)
+        self.samples = np.frombuffer(self._mmap, dtype=np.int16, offset=SPILL_HEADER.size)
+        self._raw = memoryview(self._mmap)[SPILL_HEADER.size:]
+        self.written = 0
+        self._unreleased = 0
+
+    def write(self, data):
+        super().write(data)
+        self._store_written()
+        self._unreleased += memoryview(data).nbytes
+        if self._unreleased >= self.RELEASE_BYTES:
+            self._unreleased = 0
+            if hasattr(self._mmap, "madvise"):  # not on Windows: the OS trims the working set
+                self._mmap.madvise(mmap.MADV_DONTNEED)
+
+    def reset(self):
+        super().reset()
+        self._store_written()
+
+    def _store_written(self):
+        struct.pack_into("<Q", self._mmap, SPILL_WRITTEN_OFFSET, self.written)
+
+    def close(self):
+        """Unmap and delete the spill file (left to the orphan sweep if still in use)."""
+        self.samples = self._raw = None
+        try:
+            self._mmap.close()
+            os.remove(self.path)
+        except (BufferError, OSError) as e:
+            log_error(f"Spill file kept until next start: {e}")
+
+
+def _process_alive(pid):
+    if pid == os.getpid():
+        return True
+    if sys.platform == "win32":
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)  # QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        code = ctypes.c_ulong()
+        ctypes.windll.kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # exists, owned by someone else
+    return True
+
+
+# Recovered recordings kept in DEBUG_AUDIO_DIR; older ones are pruned at startup.
+RECOVERED_PREFIX = "cyberscribe_recovered_"
+RECOVERED_KEEP = 5
+RECOVERED_MAX_AGE_DAYS = 30
+
+
+def prune_recovered_audio(keep=RECOVERED_KEEP, max_age_days=RECOVERED_MAX_AGE_DAYS):
+    """Delete recovered WAVs beyond the ``keep`` newest or older than ``max_age_days``."""
+    paths = glob.glob(os.path.join(DEBUG_AUDIO_DIR, RECOVERED_PREFIX + "*.wav"))
+    paths.sort(key=os.path.getmtime, reverse=True)
+    cutoff = time.time() - max_age_days * 86400
+    for index, path in enumerate(paths):
+        try:
+            if index >= keep or os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                log(f"Pruned recovered audio: {os.path.basename(path)}")
+        except OSError:
+            pass
+
+
+def salvage_spill_file(path):
+    """Write the audio of an orphaned spill file to DEBUG_AUDIO_DIR; returns the WAV path.
+
+    Returns None when the file holds no audio (or predates the header).
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= SPILL_HEADER.size:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, rate, pid, written = SPILL_HEADER.unpack_from(data)
+            if magic != SPILL_MAGIC or not written:
+                return None
+            capacity = (len(data) - SPILL_HEADER.size) // 2
+            start = max(0, written - capacity)
+            # Oldest sample first: the ring may have wrapped.
+            first = start % capacity
+            ranges = [(first, min(capacity, first + written - start))]
+            if written - start > capacity - first:
+                ranges.append((0, written - start - (capacity - first)))
+            os.makedirs(DEBUG_AUDIO_DIR, exist_ok=True)
+            stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(os.path.getmtime(path)))
+            out = os.path.join(DEBUG_AUDIO_DIR, f"{RECOVERED_PREFIX}{stamp}_{pid}.wav")
+            with wave.open(out, "wb") as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2)
+                wf.setframerate(rate)
+                for lo, hi in ranges:
+                    for pos in range(lo * 2, hi * 2, SpillRingBuffer.RELEASE_BYTES):
+                        end = min(hi * 2, pos + SpillRingBuffer.RELEASE_BYTES)
+                        wf.writeframes(data[SPILL_HEADER.size + pos:SPILL_HEADER.size + end])
+    return out
+
+
+def cleanup_orphan_temp_files():
+    """Remove leftover CyberScribe wav and spill files, salvaging spilled audio first.
+
+    Called by the tray app at startup only: spill files of processes still
+    running (this one included) are left alone. Recovered audio is then
+    pruned (prune_recovered_audio()).
+    """
+    temp_dir = tempfile.gettempdir()
+    for path in glob.glob(os.path.join(temp_dir, "cyberscribe_*.wav")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    for path in glob.glob(os.path.join(temp_dir, SPILL_PREFIX + "*.pcm")):
+        try:
+            with open(path, "rb") as f:
+                header = f.read(SPILL_HEADER.size)
+            if len(header) == SPILL_HEADER.size:
+                magic, _rate, pid, _written = SPILL_HEADER.unpack(header)
+                if magic == SPILL_MAGIC and _process_alive(pid):
+                    continue
+            recovered = salvage_spill_file(path)
+            if recovered:
+                log(f"Recovered audio from an interrupted recording: {recovered}")
+            os.remove(path)
+        except Exception as e:
+            log_error(f"Orphan spill file {os.path.basename(path)}: {e}")
+    prune_recovered_audio()
+
+
 class AudioRecorder:
-    def __init__(self):
-        self.audio = pyaudio.PyAudio()
+    # Slack past max_record_seconds so the auto-stop timer never races a wrap.
+    BUFFER_SLACK_SECONDS = 2
+    SAMPLE_WIDTH = 2  # int16
+
+    def __init__(self, config=None):
+        self.config = config
+        self.audio = None
         self.stream = None
-        self.frames = []
+        self.buffer = None
         self.is_recording = False
-        self.format = pyaudio.paInt16
         self.channels = 1
-        self.rate = 16000
+        self.rate = SAMPLE_RATE
         self.chunk = 1024
         self._lock = threading.Lock()
-        self._temp_files = []
+        self._init_lock = threading.Lock()
+        self._thread = None
+
+    def init_audio(self):
+        """Initialise PortAudio and the capture buffer; safe to call repeatedly.
+
+        PortAudio enumerates devices on init, which is slow on some machines,
+        so the app runs this in the background at startup instead of making
+        the first start() pay for it.
+        """
+        with self._init_lock:
+            if self.audio is None:
+                started = time.perf_counter()
+                self.audio = pyaudio.PyAudio()
+                STARTUP.add("PyAudio init", time.perf_counter() - started)
+            capacity = self._buffer_capacity()
+            spill = bool(self.config) and self.config.get("capture_backend") == "spill"
+            buffer_cls = SpillRingBuffer if spill else PcmRingBuffer
+            with self._lock:
+                if (
+                    self.buffer is None
+                    or self.buffer.capacity != capacity
+                    or type(self.buffer) is not buffer_cls
+                ):
+                    if self.buffer is not None:
+                        self.buffer.close()
+                    self.buffer = buffer_cls(capacity)
+        return self.audio
+
+    def _buffer_capacity(self):
+        seconds = 0
+        if self.config and self.config.get("chunked_recording"):
+            # ChunkedSession consumes the audio as it comes: only its backlog is kept.
+            return CHUNK_BUFFER_SECONDS * self.rate
+        if self.config:
+            try:
+                seconds = int(self.config.get("max_record_seconds"))
+            except (TypeError, ValueError):
+                seconds = 0
+        if seconds <= 0:
+            seconds = MAX_RECORD_SECONDS_CAP
+        return (seconds + self.BUFFER_SLACK_SECONDS) * self.rate
 
     def start(self):
         if self.is_recording:
             return True
+        try:
+            self.init_audio()
+        except Exception as e:
+            log_error(f"Error initialising audio: {e}")
+            return False
         with self._lock:
-            self.frames = []
+            self.buffer.reset()
         self.is_recording = True
         try:
             self.stream = self.audio.open(
-                format=self.format,
+                format=pyaudio.paInt16,
                 channels=self.channels,
                 rate=self.rate,
                 input=True,
                 frames_per_buffer=self.chunk,
             )
-            threading.Thread(target=self._record_loop, daemon=True).start()
+            self._thread = threading.Thread(target=self._record_loop, daemon=True)
+            self._thread.start()
             log("Recording started...")
             return True
         except Exception as e:
@@ -455,33 +1111,58 @@ class AudioRecorder:
             try:
                 data = self.stream.read(self.chunk, exception_on_overflow=False)
                 with self._lock:
-                    self.frames.append(data)
+                    self.buffer.write(data)
             except Exception:
                 break
 
-    def _write_wav(self, frames):
-        if not frames:
-            return None
-        fd, path = tempfile.mkstemp(suffix=".wav", prefix="cyberscribe_")
-        os.close(fd)
-        self._temp_files.append(path)
+    def captured_samples(self):
+        """Absolute number of samples captured since the last start()."""
+        buffer = self.buffer
+        return buffer.written if buffer else 0
+
+    def snapshot(self, start=0):
+        """float32 copy of the samples from absolute position ``start`` to now."""
+        taken = self.snapshot_from(start)
+        return taken[1] if taken else None
+
+    def snapshot_from(self, start):
+        """(first, samples): snapshot() plus the absolute position it really starts at.
+
+        ``first`` is later than ``start`` when that audio was already overwritten.
+        """
+        with self._lock:
+            if self.buffer is None:
+                return None
+            first = max(start, self.buffer.written - self.buffer.capacity, 0)
+            return first, pcm16_to_float32(self.buffer.view(first))
+
+    def _dump_wav(self, pcm):
+        """Debug aid: keep a copy of the captured clip under DEBUG_AUDIO_DIR."""
         try:
+            os.makedirs(DEBUG_AUDIO_DIR, exist_ok=True)
+            name = time.strftime("cyberscribe_%Y%m%d_%H%M%S.wav")
+            path = os.path.join(DEBUG_AUDIO_DIR, name)
             with wave.open(path, "wb") as wf:
                 wf.setnchannels(self.channels)
-                wf.setsampwidth(self.audio.get_sample_size(self.format))
+                wf.setsampwidth(self.SAMPLE_WIDTH)
                 wf.setframerate(self.rate)
-                wf.writeframes(b"".join(frames))
-            return path
+                wf.writeframes(pcm)
+            log(f"Debug WAV written: {name}")
         except Exception as e:
-            log_error(f"Error saving wav: {e}")
-            self._safe_remove(path)
-            return None
+            log_error(f"Error saving debug wav: {e}")
 
     def stop(self):
+        """Stop capture and return the int16 PCM as a memoryview (or None).
+
+        The view aliases the capture buffer: it is valid until the next start().
+        """
         if not self.is_recording:
             return None
         self.is_recording = False
         log("Recording stopped...")
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
         try:
             if self.stream:
                 self.stream.stop_stream()
@@ -491,135 +1172,1691 @@ class AudioRecorder:
             log_error(f"Error closing stream: {e}")
 
         with self._lock:
-            frames = list(self.frames)
-            self.frames = []
-        return self._write_wav(frames)
-
-    def cleanup_temps(self, keep=None):
-        keep = keep or set()
-        remaining = []
-        for path in self._temp_files:
-            if path in keep:
-                remaining.append(path)
-                continue
-            self._safe_remove(path)
-        self._temp_files = remaining
-
-    @staticmethod
-    def _safe_remove(path):
-        try:
-            if path and os.path.exists(path):
-                os.remove(path)
-        except Exception:
-            pass
+            if not self.buffer.written:
+                return None
+            pcm = self.buffer.view()
+        if self.config and self.config.get("debug_dump_wav"):
+            self._dump_wav(pcm)
+        return pcm
 
     def terminate(self):
         self.is_recording = False
-        self.cleanup_temps()
         try:
-            self.audio.terminate()
+            if self.audio:
+                self.audio.terminate()
         except Exception:
             pass
+        with self._lock:
+            if self.buffer is not None:
+                self.buffer.close()
+                self.buffer = None
 
 
 # ==================================================================================
 # WHISPER TRANSCRIBER
 # ==================================================================================
 
+# Approximate parameter counts (millions) and bytes per weight, for budgeting
+# models whose footprint cannot be measured (CUDA, or no RSS reading).
+MODEL_PARAMS_M = {"tiny": 39, "base": 74, "small": 244, "medium": 769, "large-v3": 1550}
+COMPUTE_BYTES = {"int8": 1, "int8_float16": 1, "int8_float32": 1, "float16": 2, "float32": 4}
+
+
+def estimate_model_mb(model_size, device, compute_type):
+    """Rough resident size of a loaded model, weights plus ~20% runtime overhead."""
+    params = MODEL_PARAMS_M.get(model_size, 244) * 1e6
+    size = params * COMPUTE_BYTES.get(compute_type, 4) * 1.2
+    return size / (1024 * 1024)
+
+
+def process_rss_bytes():
+    """Current resident set size of this process, or None if unavailable."""
+    try:
+        if sys.platform == "win32":
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(
+                handle, ctypes.byref(counters), counters.cb
+            ):
+                return counters.WorkingSetSize
+            return None
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+
+class ModelCache:
+    """LRU of loaded WhisperModel instances keyed by Transcriber target.
+
+    Entries beyond ``budget_mb`` (estimated) are evicted oldest first. Pinned
+    entries (the models the Transcriber holds) and the most recently used
+    one are always kept, whatever their size, and still count.
+    """
+
+    def __init__(self, budget_mb):
+        self.budget_mb = budget_mb or 0
+        self._entries = collections.OrderedDict()  # key -> (model, size_mb)
+        self._pinned = set()
+        self._lock = threading.Lock()
+
+    def pin(self, *keys):
+        """Pin exactly ``keys`` (None is ignored); previously pinned ones become evictable."""
+        with self._lock:
+            self._pinned = {key for key in keys if key is not None}
+            evicted = self._evict()
+        for old in evicted:
+            log(f"Model cache: evicted {self._label(old)}.")
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def resize(self, budget_mb):
+        with self._lock:
+            self.budget_mb = budget_mb or 0
+            evicted = self._evict()
+        for old in evicted:
+            log(f"Model cache: evicted {self._label(old)}.")
+
+    def put(self, key, model, size_mb):
+        with self._lock:
+            self._entries[key] = (model, size_mb)
+            self._entries.move_to_end(key)
+            evicted = self._evict()
+        for old in evicted:
+            log(f"Model cache: evicted {self._label(old)}.")
+
+    def _evict(self):
+        evicted = []
+        newest = next(reversed(self._entries), None)
+        while self._total_mb() > self.budget_mb:
+            victim = next(
+                (key for key in self._entries if key not in self._pinned and key != newest), None
+            )
+            if victim is None:
+                break
+            del self._entries[victim]
+            evicted.append(victim)
+        return evicted
+
+    def _total_mb(self):
+        return sum(size for _model, size in self._entries.values())
+
+    def residency(self):
+        """[(key, size_mb)], most recently used first."""
+        with self._lock:
+            return [(key, size) for key, (_model, size) in reversed(self._entries.items())]
+
+    @staticmethod
+    def _label(key):
+        return "/".join(key)
+
+    def describe(self):
+        entries = self.residency()
+        total = sum(size for _key, size in entries)
+        listing = ", ".join(
+            f"{self._label(key)} ~{size:.0f} MB" + (" pinned" if key in self._pinned else "")
+            for key, size in entries
+        )
+        return (
+            f"{len(entries)} resident, ~{total:.0f} MB of {self.budget_mb} MB budget"
+            + (f" ({listing})" if listing else "")
+        )
+
+
+def _load_json(path, label):
+    """Dict stored at ``path``, {} when absent or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        log_error(f"Erreur chargement {label}: {e}")
+        return {}
+
+
+def _save_json(path, data, label):
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        log_error(f"Erreur sauvegarde {label}: {e}")
+
+
+# Hardware probe: CUDA devices and compute types from CTranslate2 (no
+# nvidia-smi needed), plus the fastest compute type measured per model and
+# device. Cached next to config.json until the fingerprint changes.
+HARDWARE_FILE = os.path.join(APP_DIR, "hardware.json")
+_hardware = None
+_hardware_lock = threading.Lock()
+
+
+def _driver_signature():
+    """Something that changes with the NVIDIA driver or GPU set, or None."""
+    try:
+        if sys.platform == "win32":
+            system_root = os.environ.get("SystemRoot", r"C:\Windows")
+            dll = os.path.join(system_root, "System32", "nvcuda.dll")
+            st = os.stat(dll)
+            return f"nvcuda {st.st_size} {int(st.st_mtime)}"
+        with open("/proc/driver/nvidia/version", "r") as f:
+            version = f.readline().strip()
+        gpus = sorted(os.listdir("/proc/driver/nvidia/gpus"))
+        return f"{version} gpus={','.join(gpus)}"
+    except OSError:
+        return None
+
+
+def hardware_fingerprint():
+    try:
+        ct2_version = importlib.metadata.version("ctranslate2")
+    except Exception:
+        ct2_version = None
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "ctranslate2": ct2_version,
+        "driver": _driver_signature(),
+    }
+
+
+def probe_hardware():
+    """{"cuda_devices", "compute_types": {device: [...]}, "fastest": {...}}.
+
+    Read from HARDWARE_FILE when its fingerprint still matches, otherwise
+    queried from CTranslate2 and saved. Kept in memory for the process.
+    """
+    global _hardware
+    with _hardware_lock:
+        if _hardware is not None:
+            return _hardware
+        fingerprint = hardware_fingerprint()
+        cached = _load_json(HARDWARE_FILE, "hardware")
+        if cached.get("fingerprint") == fingerprint:
+            _hardware = cached
+            return _hardware
+        started = time.monotonic()
+        try:
+            cuda_devices = ctranslate2.get_cuda_device_count()
+        except Exception:
+            cuda_devices = 0
+        compute_types = {}
+        for device in ("cpu", "cuda") if cuda_devices else ("cpu",):
+            try:
+                compute_types[device] = sorted(ctranslate2.get_supported_compute_types(device))
+            except Exception as e:
+                log_error(f"Hardware probe: {device} compute types unavailable: {e}")
+        _hardware = {
+            "fingerprint": fingerprint,
+            "cuda_devices": cuda_devices,
+            "compute_types": compute_types,
+            "fastest": {},
+            "benchmarks": {},
+        }
+        _save_json(HARDWARE_FILE, _hardware, "hardware")
+        log(
+            f"Hardware probe: {cuda_devices} CUDA device(s), compute types {compute_types} "
+            f"({time.monotonic() - started:.2f}s)."
+        )
+        return _hardware
+
+
+def record_compute_benchmark(model_size, device, timings_ms):
+    """Store a compute-type benchmark; returns the fastest type."""
+    fastest = min(timings_ms, key=timings_ms.get)
+    hardware = probe_hardware()
+    with _hardware_lock:
+        label = f"{model_size}/{device}"
+        hardware["benchmarks"][label] = timings_ms
+        hardware["fastest"][label] = fastest
+        _save_json(HARDWARE_FILE, hardware, "hardware")
+    return fastest
+
+
+def resolve_model_target(config, model_size=None):
+    """Return the (model_size, device, compute_type) the config asks for.
+
+    ``model_size`` overrides the configured one (the cascade model). With
+    compute type "auto" it is the fastest one benchmarked for this model on
+    this device, once that is known (int8 until then).
+    """
+    model_size = model_size or config.get("model_size")
+    device_pref = (config.get("device") or "auto").lower()
+    compute_pref = (config.get("compute_type") or "auto").lower()
+    hardware = probe_hardware()
+    has_cuda = hardware["cuda_devices"] > 0
+
+    if device_pref == "auto":
+        device = "cuda" if has_cuda else "cpu"
+    else:
+        device = device_pref
+
+    if device == "cuda" and not has_cuda:
+        log_error("CUDA selected but no CUDA device found. Falling back to CPU.")
+        device = "cpu"
+
+    if compute_pref == "auto":
+        fastest = hardware["fastest"].get(f"{model_size}/{device}")
+        if fastest:
+            return model_size, device, fastest
+        compute_pref = "int8"
+
+    if device == "cuda":
+        compute_type = "int8_float16" if compute_pref == "int8" else compute_pref
+    else:
+        compute_type = "int8" if compute_pref in ("int8_float16", "float16") else compute_pref
+    supported = hardware["compute_types"].get(device)
+    if supported and compute_type not in supported:
+        fallback = "int8" if "int8" in supported else "float32"
+        log_error(f"{compute_type} not supported on {device}, using {fallback}.")
+        compute_type = fallback
+    return model_size, device, compute_type
+
+
+def load_calibration():
+    """{"model/device/compute": entry} from CALIBRATION_FILE, {} when absent."""
+    return _load_json(CALIBRATION_FILE, "calibration")
+
+
+def save_calibration(data):
+    _save_json(CALIBRATION_FILE, data, "calibration")
+
+
+def _profile_latency_ms(rtf):
+    return rtf * CALIBRATION_CLIP_SECONDS * 1000
+
+
+def choose_profile(entry, target_ms):
+    """Most accurate preset whose real decode time fits ``target_ms`` (else "fast").
+
+    ``entry`` holds the smoothed RTF measured per preset on dictations. A
+    preset never used yet is tried once the one below it has
+    CALIBRATION_MIN_DICTATIONS and, scaled by beam size, would still fit.
+    """
+    rtf = entry.get("rtf", {})
+    counts = entry.get("dictations", {})
+    chosen = "fast"
+    for profile in reversed(PROFILE_QUALITY_ORDER):
+        if profile in rtf:
+            if _profile_latency_ms(rtf[profile]) > target_ms:
+                break
+            chosen = profile
+            continue
+        if chosen in rtf and counts.get(chosen, 0) >= CALIBRATION_MIN_DICTATIONS:
+            scale = PROFILE_PRESETS[profile]["beam_size"] / PROFILE_PRESETS[chosen]["beam_size"]
+            if _profile_latency_ms(rtf[chosen]) * scale <= target_ms:
+                chosen = profile
+        break
+    return chosen
+
+
+def calibrated_profile(key, config):
+    """The "auto" choice recorded for ``key``, or "fast" if it was never calibrated."""
+    entry = load_calibration().get("/".join(key))
+    if not entry:
+        return "fast"
+    return choose_profile(entry, config.get("latency_target_ms"))
+
+
+CT2_DEFAULT_THREADS = 4  # what CTranslate2 uses for cpu_threads=0
+
+
+def resolve_thread_budget(config, cpu_threads=None, num_workers=None):
+    """Return (cpu_threads, num_workers) for WhisperModel.
+
+    ``cpu_threads`` is per worker: 0 keeps CTranslate2's default (4), -1
+    splits the cores left after ``reserved_cores`` (kept free for the
+    foreground app) across the workers. Any count is capped to that share
+    when ``reserved_cores`` is set. Arguments override the config values.
+    """
+    if num_workers is None:
+        num_workers = config.get("num_workers")
+    if cpu_threads is None:
+        cpu_threads = config.get("cpu_threads")
+    num_workers = max(1, int(num_workers or 1))
+    cpu_threads = int(cpu_threads or 0)
+    reserved = int(config.get("reserved_cores") or 0)
+    share = max(1, ((os.cpu_count() or 1) - reserved) // num_workers)
+    if cpu_threads < 0:
+        cpu_threads = share
+    elif reserved:
+        cpu_threads = min(cpu_threads or CT2_DEFAULT_THREADS, share)
+    return cpu_threads, num_workers
+
+
+def thread_layout(cpu_threads, num_workers):
+    """Model/calibration key suffix for a thread budget, e.g. "4x1"."""
+    return f"{cpu_threads}x{num_workers}"
+
+
+def preset_decode_options(config, profile=None):
+    """WhisperModel.transcribe() kwargs for the configured language and profile.
+
+    ``profile`` overrides the configured one; "auto" must be resolved first.
+    """
+    lang = config.get("language")
+    if lang == "auto":
+        lang = None
+    profile = profile or config.get("transcription_profile") or "fast"
+    preset = PROFILE_PRESETS.get(profile, PROFILE_PRESETS["fast"])
+    return {
+        "beam_size": preset["beam_size"],
+        "best_of": preset["best_of"],
+        "language": lang,
+        "condition_on_previous_text": preset["condition_on_previous_text"],
+        "vad_filter": preset["vad_filter"],
+        "vad_parameters": preset["vad_parameters"],
+        "no_speech_threshold": preset["no_speech_threshold"],
+        "log_prob_threshold": preset["log_prob_threshold"],
+    }
+
+
+# Clip-length-adaptive decoding, see decode_strategy()
+SHORT_CLIP_OVERRIDES = {"beam_size": 1, "best_of": 1, "temperature": 0.0, "vad_filter": False}
+GREEDY_OVERRIDES = {"beam_size": 1, "best_of": 1}
+LONG_CLIP_BATCH_SIZE = 8
+
+
+def decode_strategy(seconds, config, rtf=None):
+    """Return (name, transcribe overrides) for a clip of ``seconds``.
+
+    - "short": greedy, no VAD, no temperature fallback. A few words leave
+      nothing to skip and a retry would double the latency.
+    - "long": the batched pipeline decodes the VAD chunks together.
+    - "budget": greedy, because the smoothed RTF says the preset would
+      overshoot latency_target_ms. Only under the "auto" profile: an
+      explicitly chosen preset is never downgraded for speed.
+    - "preset": the profile as configured.
+    """
+    if not config.get("adaptive_decoding"):
+        return "preset", {}
+    if seconds <= config.get("short_clip_seconds"):
+        return "short", dict(SHORT_CLIP_OVERRIDES)
+    if seconds >= config.get("long_clip_seconds"):
+        return "long", {"vad_filter": True}
+    if (
+        config.get("transcription_profile") == "auto"
+        and rtf
+        and rtf * seconds * 1000 > config.get("latency_target_ms")
+    ):
+        return "budget", dict(GREEDY_OVERRIDES)
+    return "preset", {}
+
+
+def cascade_reason(segments, config):
+    """Why a first-pass decode should be redone by the cascade model, or None."""
+    if not segments:
+        return None
+    avg_logprob = sum(segment.avg_logprob for segment in segments) / len(segments)
+    if avg_logprob < config.get("cascade_logprob"):
+        return f"avg log-prob {avg_logprob:.2f}"
+    ratio = max(segment.compression_ratio for segment in segments)
+    if ratio > config.get("cascade_compression_ratio"):
+        return f"compression ratio {ratio:.2f}"
+    no_speech = sum(segment.no_speech_prob for segment in segments) / len(segments)
+    if no_speech > config.get("cascade_no_speech"):
+        return f"no-speech prob {no_speech:.2f}"
+    return None
+
+
+# "auto" language: clips shorter than this are detected but never made sticky
+LANGUAGE_DETECT_MIN_SECONDS = 3.0
+
+
 class Transcriber:
-    def __init__(self, config):
+    def __init__(self, config, on_state_change=None):
         self.config = config
+        self.on_state_change = on_state_change
         self.model = None
         self.loading = False
         self.loaded_event = threading.Event()
-        self._transcribe_lock = threading.Lock()
-        threading.Thread(target=self._load_model, daemon=True).start()
-
-    def _load_model(self):
-        self.loading = True
+        self._decode_slots = threading.BoundedSemaphore(self._max_parallel())
+        self.rtf = None  # smoothed decode seconds per audio second
+        self.model_key = None  # _resolve_target() of self.model
+        self.auto_profile = None  # preset chosen by calibrate() for "auto"
+        self.sticky_language = None  # (code, probability) reused under language "auto"
+        self.cascade = None  # larger resident model for low-confidence decodes
+        self.cascade_key = None
+        self.cascade_stats = {"decodes": 0, "escalations": 0, "seconds": 0.0}
+        # (model, BatchedInferencePipeline) for long clips; concurrent decodes
+        # may both build it after a swap, which is harmless.
+        self._batched = None
+        self.cache = ModelCache(config.get("model_cache_mb"))
+        self._generation = 0
+        self._loads_in_flight = 0
+        self._state_lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        threading.Thread(target=self._load_model, args=(0,), daemon=True).start()
+
+    def _notify_state(self):
+        if self.on_state_change:
+            try:
+                self.on_state_change()
+            except Exception as e:
+                log_error(f"State callback failed: {e}")
+
+    def _resolve_target(self, model_size=None):
+        """(model_size, device, compute_type, "<threads>x<workers>")."""
+        cpu_threads, num_workers = resolve_thread_budget(self.config)
+        target = resolve_model_target(self.config, model_size)
+        return target + (thread_layout(cpu_threads, num_workers),)
+
+    def _cascade_target(self, size):
+        """_resolve_target() for the cascade model, kept within model_cache_mb.
+
+        Under compute type "auto" a benchmarked type that would not fit next
+        to the primary model falls back to int8.
+        """
+        key = self._resolve_target(size)
+        budget = self.config.get("model_cache_mb")
+        if (
+            (self.config.get("compute_type") or "auto") == "auto"
+            and COMPUTE_BYTES.get(key[2], 4) > 1
+            and self._resident_mb(self.model_key) + self._resident_mb(key) > budget
+        ):
+            compute_type = "int8_float16" if key[1] == "cuda" else "int8"
+            log(
+                f"Cascade {size} as {key[2]} would exceed the {budget} MB model budget, "
+                f"using {compute_type}."
+            )
+            key = key[:2] + (compute_type,) + key[3:]
+        return key
+
+    def resize_decode_slots(self):
+        """Apply max_concurrent_transcriptions; decodes in flight release their old slot."""
+        self._decode_slots = threading.BoundedSemaphore(self._max_parallel())
+
+    def _max_parallel(self):
+        """Concurrent decodes: beyond num_workers they would only queue in CTranslate2."""
+        _threads, num_workers = resolve_thread_budget(self.config)
+        return max(1, min(int(self.config.get("max_concurrent_transcriptions") or 1), num_workers))
+
+    def _load_model(self, generation):
+        """Load (or fetch from cache) the configured model, then swap it in.
+
+        Runs one load at a time. A load superseded by a newer reload() is
+        skipped; a failed load leaves the current model in place. "loading"
+        ends at the swap: the cascade, benchmark and calibration that follow
+        run while the new model is serving.
+        """
+        with self._state_lock:
+            self._loads_in_flight += 1
+            self.loading = True
+        self._notify_state()
+        serving = False
         try:
-            model_size = self.config.get("model_size")
-            device_pref = (self.config.get("device") or "auto").lower()
-            compute_pref = (self.config.get("compute_type") or "int8").lower()
-            has_nvidia = detect_nvidia_gpu()
-
-            if device_pref == "auto":
-                device = "cuda" if has_nvidia else "cpu"
+            with self._load_lock:
+                if generation != self._generation:
+                    return
+                key, model = self._build_model()
+                if generation != self._generation:
+                    log("Model load superseded by a newer configuration.")
+                    return
+                previous, self.model = self.model, model
+                self.model_key = key
+                self.cache.pin(key, self.cascade_key)
+                self.auto_profile = None
+                self.resize_decode_slots()
+                if previous is not None and previous is not model:
+                    # The old model now lives on only in the cache (budget
+                    # permitting) and in decodes that already hold it.
+                    log("Model hot-swapped.")
+            serving = True
+            self._end_load()
+            # Serving already: bring up the cascade model, settle the compute
+            # types (which may hot-swap again), then pick the "auto" preset.
+            self._load_cascade(generation)
+            if self._tune_compute_type(generation, self.model_key, self.model):
+                self.reload()
+                return
+            cascade, cascade_key = self.cascade, self.cascade_key
+            if cascade is not None and self._tune_compute_type(
+                generation, cascade_key, cascade, self._resident_mb(self.model_key)
+            ):
+                self._load_cascade(generation)
+            self.calibrate()
+        except Exception as e:
+            if self.model is not None:
+                log_error(f"Error loading model, keeping the current one: {e}")
             else:
-                device = device_pref
+                log_error(f"Error loading model: {e}")
+        finally:
+            if not serving:
+                self._end_load()
+
+    def _end_load(self):
+        with self._state_lock:
+            self._loads_in_flight -= 1
+            self.loading = self._loads_in_flight > 0
+        self.loaded_event.set()
+        self._notify_state()
+
+    def _load_cascade(self, generation):
+        """Load (or drop) the larger model that low-confidence decodes escalate to."""
+        size = self.config.get("cascade_model")
+        primary = self.model_key[0]
+        enabled = self.config.get("cascade_enabled")
+        if enabled and MODEL_PARAMS_M[size] <= MODEL_PARAMS_M[primary]:
+            log_error(f"Cascade model {size} is not larger than {primary}: cascade disabled.")
+            enabled = False
+        if not enabled:
+            if self.cascade is not None:
+                log("Cascade disabled.")
+            self.cascade = self.cascade_key = None
+            self.cache.pin(self.model_key)
+            return
+        try:
+            with self._load_lock:
+                if generation != self._generation:
+                    return
+                key, model = self._build_model(key=self._cascade_target(size))
+                if generation != self._generation:
+                    return
+                self.cascade, self.cascade_key = model, key
+                self.cache.pin(self.model_key, key)
+            log(f"Cascade ready: {self.model_key[0]} first, {size} on low confidence.")
+        except Exception as e:
+            log_error(f"Error loading cascade model {size}: {e}")
 
-            if device == "cuda" and not has_nvidia:
-                log_error("CUDA selected but no NVIDIA GPU detected. Falling back to CPU.")
-                device = "cpu"
+    @staticmethod
+    def _resident_mb(key):
+        model_size, device, compute_type = key[:3]
+        return estimate_model_mb(model_size, device, compute_type)
+
+    def _tune_compute_type(self, generation, key, model, others_mb=0.0):
+        """With compute type "auto", benchmark compute types once for ``key``'s model and device.
+
+        ``model`` is the loaded instance of ``key``; ``others_mb`` what other
+        resident models take. The fastest is stored in HARDWARE_FILE and used
+        by resolve_model_target(); returns True when it differs from ``key``'s.
+        Candidates that would not fit in model_cache_mb next to the resident
+        models are skipped.
+        """
+        if (self.config.get("compute_type") or "auto") != "auto":
+            return False
+        model_size, device, current = key[:3]
+        hardware = probe_hardware()
+        if f"{model_size}/{device}" in hardware["fastest"]:
+            return False
+        supported = hardware["compute_types"].get(device, ())
+        budget = self.config.get("model_cache_mb")
+        resident = others_mb + self._resident_mb(key)
+        candidates = []
+        for compute_type in sorted(set(COMPUTE_BYTES) & set(supported)):
+            needed = estimate_model_mb(model_size, device, compute_type)
+            if compute_type != current and resident + needed > budget:
+                log(
+                    f"Skipping {compute_type} benchmark for {model_size}: ~{needed:.0f} MB "
+                    f"next to the resident models exceeds the {budget} MB model budget."
+                )
+                continue
+            candidates.append(compute_type)
+        if len(candidates) < 2:
+            return False
+        log(f"Benchmarking compute types for {model_size} on {device}: {', '.join(candidates)}...")
+        timings = self._benchmark_compute_types(key, model, candidates)
+        if not timings or generation != self._generation:
+            return False
+        fastest = record_compute_benchmark(model_size, device, timings)
+        listing = ", ".join(f"{name} {ms:.0f} ms" for name, ms in sorted(timings.items()))
+        log(f"Fastest compute type for {model_size} on {device}: {fastest} ({listing}).")
+        return fastest != current
+
+    def _benchmark_compute_types(self, key, current, candidates):
+        """{compute_type: ms} for a greedy decode of a synthetic clip, per candidate.
+
+        ``current`` is the loaded model for ``key``; other candidates are
+        loaded one at a time and released.
+        """
+        model_size, device = key[:2]
+        cpu_threads, num_workers = resolve_thread_budget(self.config)
+        options = preset_decode_options(self.config, "fast")
+        options["vad_filter"] = False
+        clip = self._synthetic_clip(CALIBRATION_CLIP_SECONDS)
+        timings = {}
+        for compute_type in candidates:
+            try:
+                if compute_type == key[2]:
+                    model = current
+                else:
+                    model = faster_whisper.WhisperModel(
+                        model_size,
+                        device=device,
+                        compute_type=compute_type,
+                        cpu_threads=cpu_threads,
+                        num_workers=num_workers,
+                        download_root=MODELS_DIR,
+                    )
+                # In a decode slot: dictations wait instead of sharing the CPU
+                # with the benchmark (and skewing it).
+                with self._decode_slots:
+                    list(model.transcribe(clip, **options)[0])  # warm-up
+                    started = time.monotonic()
+                    list(model.transcribe(clip, **options)[0])
+                    timings[compute_type] = round((time.monotonic() - started) * 1000, 1)
+            except Exception as e:
+                log_error(f"Benchmark of {compute_type} on {device} failed: {e}")
+            model = None  # release before loading the next candidate
+        return timings
+
+    def _build_model(self, key=None):
+        """Return (key, model): a loaded, warmed model for ``key`` (cache first).
+
+        ``key`` defaults to the configured primary model, _resolve_target().
+        """
+        key = key or self._resolve_target()
+        model_size, device, compute_type, _threads = key
+        cpu_threads, num_workers = resolve_thread_budget(self.config)
+        self.cache.budget_mb = self.config.get("model_cache_mb")
+        model = self.cache.get(key)
+        if model is not None:
+            log(f"Model {model_size} on {device} ({compute_type}, {_threads}) reused from cache.")
+            log(f"Model cache: {self.cache.describe()}")
+            return key, model
+
+        log(
+            f"Loading Whisper Model ({model_size}) on {device} ({compute_type}), "
+            f"{num_workers} worker(s) x {cpu_threads or 'default'} thread(s)..."
+        )
+        whisper_model_cls = faster_whisper.WhisperModel  # import before measuring RSS
+        rss_before = process_rss_bytes()
+        started = time.monotonic()
+        model = whisper_model_cls(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
+            download_root=MODELS_DIR,
+        )
+        load_seconds = time.monotonic() - started
+        log(f"Model loaded successfully in {load_seconds:.2f}s.")
+        warm_seconds = self._warm_up(model)
+        rss_after = process_rss_bytes()
+        measured_mb = None
+        if device == "cpu" and rss_before and rss_after and rss_after > rss_before:
+            measured_mb = (rss_after - rss_before) / (1024 * 1024)
+        self.cache.put(
+            key, model, measured_mb or estimate_model_mb(model_size, device, compute_type)
+        )
+        log(f"Model cache: {self.cache.describe()}")
+        if not STARTUP.reported:
+            STARTUP.add("model load", load_seconds)
+            STARTUP.add("model warm-up", warm_seconds)
+            STARTUP.milestone("model ready")
+            STARTUP.report()
+        return key, model
+
+    def _warm_up(self, model):
+        """Run a short synthetic clip through the active preset.
+
+        The first decode pays one-time allocations and kernel setup; doing it
+        here keeps that cost off the user's first dictation.
+        """
+        started = time.monotonic()
+        try:
+            self._decode(self._synthetic_clip(1.0), model, vad_filter=False)
+            log(f"Model warm-up done in {time.monotonic() - started:.2f}s.")
+        except Exception as e:
+            log_error(f"Model warm-up failed: {e}")
+        return time.monotonic() - started
 
-            if device == "cuda":
-                compute_type = "int8_float16" if compute_pref == "int8" else compute_pref
-            else:
-                compute_type = "int8" if compute_pref in ("int8_float16", "float16") else compute_pref
+    @staticmethod
+    def _synthetic_clip(seconds):
+        rng = np.random.default_rng(0)
+        return (rng.standard_normal(int(SAMPLE_RATE * seconds)) * 0.01).astype(np.float32)
+
+    def calibrate(self, force=False):
+        """Resolve the "auto" profile for the loaded model; returns it or None.
+
+        Nothing is decoded here: the choice comes from the decode speed
+        record_decode() learnt on real dictations for this model key, kept in
+        CALIBRATION_FILE. ``force`` forgets those measurements.
+        """
+        if self.config.get("transcription_profile") != "auto":
+            return None
+        model, key = self.model, self.model_key
+        if model is None or key is None:
+            return None
+        label = "/".join(key)
+        with _calibration_lock:
+            data = load_calibration()
+            if force and data.pop(label, None) is not None:
+                save_calibration(data)
+            entry = data.get(label) or {}
+        target = self.config.get("latency_target_ms")
+        if model is self.model:
+            self.auto_profile = choose_profile(entry, target)
+        measured = ", ".join(
+            f"{p} {_profile_latency_ms(rtf):.0f} ms" for p, rtf in entry.get("rtf", {}).items()
+        )
+        log(
+            f"Auto profile for {label}: {self.auto_profile} (target {target} ms "
+            f"per {CALIBRATION_CLIP_SECONDS}s; {measured or 'not measured yet'})."
+        )
+        return self.auto_profile
 
-            log(f"Loading Whisper Model ({model_size}) on {device} ({compute_type})...")
-            self.model = WhisperModel(
-                model_size, device=device, compute_type=compute_type, download_root=MODELS_DIR
+    def record_decode(self, key, profile, seconds, elapsed):
+        """Learn ``profile``'s real RTF on ``key`` from one preset decode, then re-pick "auto"."""
+        if seconds < CALIBRATION_MIN_CLIP_SECONDS:
+            return
+        label = "/".join(key)
+        rtf = elapsed / seconds
+        with _calibration_lock:
+            data = load_calibration()
+            entry = data.setdefault(label, {})
+            measured = entry.setdefault("rtf", {})
+            counts = entry.setdefault("dictations", {})
+            previous = measured.get(profile)
+            measured[profile] = round(rtf if previous is None else 0.7 * previous + 0.3 * rtf, 4)
+            counts[profile] = counts.get(profile, 0) + 1
+            entry["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+            save_calibration(data)
+        if key != self.model_key:
+            return
+        chosen = choose_profile(entry, self.config.get("latency_target_ms"))
+        if chosen != (self.auto_profile or "fast"):
+            log(
+                f"Auto profile for {label}: {self.auto_profile or 'fast'} -> {chosen} "
+                f"({profile} measured at {_profile_latency_ms(measured[profile]):.0f} ms "
+                f"per {CALIBRATION_CLIP_SECONDS}s)."
             )
-            log("Model loaded successfully.")
-        except Exception as e:
-            log_error(f"Error loading model: {e}")
-            self.model = None
-        finally:
-            self.loaded_event.set()
-            self.loading = False
+            self.auto_profile = chosen
 
     def reload(self):
-        """Reload Whisper after model/device/compute settings change."""
-        def _reload():
-            with self._transcribe_lock:
-                self.model = None
+        """Reload Whisper after model/device/compute settings change.
+
+        Blue/green: the current model keeps serving while the new one loads
+        and warms up in the background, then the reference is swapped.
+        """
+        with self._state_lock:
+            self._generation += 1
+            generation = self._generation
+            if self.model is None:
+                # Nothing to keep serving: let transcribe() wait for this load.
                 self.loaded_event.clear()
-                self._load_model()
+        threading.Thread(target=self._load_model, args=(generation,), daemon=True).start()
+
+    def _wait_for_model(self):
+        if self.model:
+            return True
+        if not self.loading and not self.loaded_event.is_set():
+            log_error("Model not initialized.")
+            return False
 
-        threading.Thread(target=_reload, daemon=True).start()
+        log("Model not ready. Waiting for load to complete...")
+        if not self.loaded_event.wait(timeout=120):
+            log_error("Timeout waiting for model load.")
+            return False
 
-    def transcribe(self, audio_path):
         if not self.model:
-            if not self.loading and not self.loaded_event.is_set():
-                log_error("Model not initialized.")
-                return None
+            log_error("Model failed to load.")
+            return False
+        return True
 
-            log("Model not ready. Waiting for load to complete...")
-            if not self.loaded_event.wait(timeout=120):
-                log_error("Timeout waiting for model load.")
+    def _decode_options(self):
+        if self.config.get("transcription_profile") == "auto":
+            # Until calibrate() has run, "auto" decodes as "fast".
+            return preset_decode_options(self.config, self.auto_profile or "fast")
+        return preset_decode_options(self.config)
+
+    def _decode(self, audio, model, batched=False, **overrides):
+        options = self._decode_options()
+        options.update(overrides)
+        if batched:
+            segments, _info = self._batched_pipeline(model).transcribe(
+                audio, batch_size=LONG_CLIP_BATCH_SIZE, **options
+            )
+        else:
+            segments, _info = model.transcribe(audio, **options)
+        return list(segments)
+
+    def _batched_pipeline(self, model):
+        """Batched wrapper around ``model``, rebuilt after a hot-swap."""
+        if self._batched is None or self._batched[0] is not model:
+            self._batched = (model, faster_whisper.BatchedInferencePipeline(model=model))
+        return self._batched[1]
+
+    def transcribe_segments(self, audio, wait=True, trace=None, dictation=False, **overrides):
+        """Decode ``audio`` and return its segments, or None on failure.
+
+        With ``wait=False`` a model that is still loading is not waited for.
+        In-memory clips go through decode_strategy(); ``overrides`` replace
+        individual decode options on top of it. Time spent waiting for the
+        model and decoding is added to ``trace`` if given. Only tray
+        dictations (``dictation=True``) use and update the sticky language.
+        """
+        waiting = time.monotonic()
+        if not self.model and (not wait or not self._wait_for_model()):
+            return None
+        strategy, options = "preset", {}
+        if isinstance(audio, np.ndarray):
+            seconds = audio.size / SAMPLE_RATE
+            strategy, options = decode_strategy(seconds, self.config, self.rtf)
+            if strategy != "preset":
+                log(f"Decode strategy: {strategy} ({seconds:.1f}s clip).")
+        options.update(overrides)
+        with self._decode_slots:
+            try:
+                # One reference for the whole decode: a hot-swap can't pull it away.
+                model, key, cascade = self.model, self.model_key, self.cascade
+                learn_profile = (
+                    self.config.get("transcription_profile") == "auto"
+                    and strategy == "preset"
+                    and isinstance(audio, np.ndarray)
+                    and "beam_size" not in options
+                )
+                profile = self.auto_profile or "fast"
+                acquired = time.monotonic()
+                auto_language = (
+                    self.config.get("language") == "auto"
+                    and "language" not in options
+                    and isinstance(audio, np.ndarray)
+                )
+                if auto_language:
+                    options["language"] = self._auto_language(audio, model, dictation)
+                elif dictation:
+                    self.sticky_language = None
+                if trace:
+                    # Always recorded (0 when nothing was detected) so every
+                    # dictation has the stage and the percentiles compare.
+                    trace.add("language", time.monotonic() - acquired if auto_language else 0.0)
+                started = time.monotonic()
+                segments = self._decode(audio, model, batched=strategy == "long", **options)
+                elapsed = time.monotonic() - started
+                if learn_profile and key is not None:
+                    self.record_decode(key, profile, audio.size / SAMPLE_RATE, elapsed)
+                if cascade is not None:
+                    segments = self._escalate(
+                        audio, segments, cascade, strategy == "long", options, trace
+                    )
+                if auto_language and dictation:
+                    self._check_sticky_language(segments)
+                if strategy != "short":
+                    # Short clips pay Whisper's 30s window padding: their RTF
+                    # would inflate the estimate used for longer ones.
+                    self._track_rtf(audio, elapsed)
+                if trace:
+                    trace.add("model_wait", acquired - waiting)
+                    trace.add("decode", elapsed)
+                return segments
+            except Exception as e:
+                log_error(f"Transcription error: {e}")
                 return None
 
-            if not self.model:
-                log_error("Model failed to load.")
+    def _escalate(self, audio, segments, cascade, batched, options, trace=None):
+        """Re-decode with ``cascade`` when the first pass looks unreliable."""
+        reason = cascade_reason(segments, self.config)
+        if reason is None:
+            with self._state_lock:
+                self.cascade_stats["decodes"] += 1
+            return segments
+        started = time.monotonic()
+        segments = self._decode(audio, cascade, batched=batched, **options)
+        cost = time.monotonic() - started
+        if trace:
+            trace.add("cascade", cost)
+        with self._state_lock:
+            stats = self.cascade_stats
+            stats["decodes"] += 1
+            stats["escalations"] += 1
+            stats["seconds"] += cost
+            rate = stats["escalations"] / stats["decodes"]
+            summary = (
+                f"escalation rate {stats['escalations']}/{stats['decodes']} ({rate:.0%}), "
+                f"{stats['seconds']:.1f}s extra decode so far"
+            )
+        log(
+            f"Cascade: {reason}, re-decoded with {self.config.get('cascade_model')} "
+            f"in {cost:.2f}s; {summary}."
+        )
+        return segments
+
+    def _auto_language(self, audio, model, dictation=False):
+        """Language to decode ``audio`` with under "auto"; None lets Whisper decide.
+
+        For a dictation, a detection made on a clip of at least
+        LANGUAGE_DETECT_MIN_SECONDS with probability >= language_min_probability
+        becomes sticky: later dictations reuse it without detecting.
+        language_candidates, if set, restricts the choice.
+        """
+        if dictation and self.sticky_language:
+            return self.sticky_language[0]
+        candidates = self.config.get("language_candidates")
+        seconds = audio.size / SAMPLE_RATE
+        if not candidates and seconds < LANGUAGE_DETECT_MIN_SECONDS:
+            return None  # nothing to keep: transcribe()'s own detection costs the same
+        started = time.monotonic()
+        _code, _prob, all_probs = model.detect_language(audio)
+        if candidates:
+            all_probs = [(code, p) for code, p in all_probs if code in candidates] or all_probs
+        code, prob = max(all_probs, key=lambda item: item[1])
+        elapsed = (time.monotonic() - started) * 1000
+        sticky = (
+            dictation
+            and seconds >= LANGUAGE_DETECT_MIN_SECONDS
+            and prob >= self.config.get("language_min_probability")
+        )
+        if sticky:
+            self.sticky_language = (code, prob)
+        log(
+            f"Language detected: {code} (p={prob:.2f}) in {elapsed:.0f} ms"
+            + (", sticky." if sticky else ".")
+        )
+        return code
+
+    def _check_sticky_language(self, segments):
+        """Drop the sticky language when a decode with it looks wrong."""
+        if not self.sticky_language or not segments:
+            return
+        avg_logprob = sum(segment.avg_logprob for segment in segments) / len(segments)
+        if avg_logprob < self.config.get("language_redetect_logprob"):
+            log(
+                f"Sticky language {self.sticky_language[0]} dropped "
+                f"(avg log-prob {avg_logprob:.2f}), detecting again on the next clip."
+            )
+            self.sticky_language = None
+
+    def _track_rtf(self, audio, elapsed):
+        if not isinstance(audio, np.ndarray) or not audio.size:
+            return
+        rtf = elapsed / (audio.size / SAMPLE_RATE)
+        self.rtf = rtf if self.rtf is None else 0.7 * self.rtf + 0.3 * rtf
+
+    def gate_silence(self, audio, trace=None):
+        """Trim leading/trailing silence; None when the clip holds no speech."""
+        if not self.config.get("silence_trim") or not isinstance(audio, np.ndarray):
+            return audio
+        started = time.monotonic()
+        min_dbfs = self.config.get("silence_gate_dbfs")
+        bounds = find_speech_bounds(audio, SAMPLE_RATE, min_dbfs)
+        if trace:
+            trace.add("vad", time.monotonic() - started)
+        if bounds is None:
+            cut = audio.size
+        else:
+            cut = audio.size - (bounds[1] - bounds[0])
+        if cut:
+            seconds = cut / SAMPLE_RATE
+            saved = f", ~{seconds * self.rtf:.2f}s model time saved" if self.rtf else ""
+            if bounds is None:
+                peak = loudest_frame_dbfs(audio, SAMPLE_RATE)
+                level = f"loudest frame {peak:.0f} dBFS" if peak is not None else "too short"
+                log(
+                    f"Silence gate: no speech in {seconds:.1f}s clip ({level}, "
+                    f"gate floor {min_dbfs:.0f} dBFS), inference skipped{saved}."
+                )
+                if trace:
+                    trace.outcome = "silent"
+            else:
+                log(f"Silence gate: trimmed {seconds:.1f}s of silence{saved}.")
+        if bounds is None:
+            return None
+        return audio[bounds[0]:bounds[1]]
+
+    def transcribe(self, audio, trace=None, dictation=False, **overrides):
+        """Transcribe float32 16 kHz mono samples (a file path also works)."""
+        audio = self.gate_silence(audio, trace)
+        if audio is None:
+            return ""
+        log("Starting transcription...")
+        segments = self.transcribe_segments(audio, trace=trace, dictation=dictation, **overrides)
+        if segments is None:
+            return None
+        text_result = "".join([segment.text for segment in segments]).strip()
+        log(f"Transcription finished. ({len(text_result)} chars)")
+        return text_result
+
+    def start_stream(self, recorder):
+        """Begin transcribing ``recorder``'s capture while it is still running."""
+        return StreamingSession(self, recorder)
+
+    def start_chunked(self, recorder):
+        """Begin cutting ``recorder``'s capture into chunks decoded as it runs."""
+        return ChunkedSession(self, recorder)
+
+
+class StreamingSession:
+    """Incremental transcription of a recording that is still being captured.
+
+    Every STEP_SECONDS the uncommitted audio (last commit point to "now") is
+    decoded. Segments that end before the trailing OVERLAP_SECONDS of that
+    window are committed and the commit point moves past them; the rest is
+    decoded again on the next pass, with more context. At stop only the
+    uncommitted tail is left to decode.
+    """
+
+    STEP_SECONDS = 2.0
+    MIN_WINDOW_SECONDS = 4.0
+    OVERLAP_SECONDS = 1.5
+    MAX_WINDOW_SECONDS = 25.0
+
+    def __init__(self, transcriber, recorder):
+        self.transcriber = transcriber
+        self.recorder = recorder
+        self.rate = recorder.rate
+        self.committed_pos = 0
+        self.committed_text = []
+        self.end_pos = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while not self._stop.wait(self.STEP_SECONDS):
+            pending = self.recorder.captured_samples() - self.committed_pos
+            if pending < self.MIN_WINDOW_SECONDS * self.rate:
+                continue
+            window = self.recorder.snapshot(self.committed_pos)
+            if window is None or self._stop.is_set():
+                continue
+            segments = self.transcriber.transcribe_segments(window, wait=False, dictation=True)
+            if segments is not None:
+                self._commit(segments, window.size / self.rate)
+
+    def _commit(self, segments, window_seconds):
+        limit = window_seconds - self.OVERLAP_SECONDS
+        if not segments:
+            # Nothing but silence so far: drop it, keep the overlap.
+            if limit > 0:
+                self.committed_pos += int(limit * self.rate)
+            return
+        if window_seconds >= self.MAX_WINDOW_SECONDS:
+            ready = segments[:-1]
+        else:
+            ready = []
+            for segment in segments:
+                if segment.end > limit:
+                    break
+                ready.append(segment)
+        if not ready:
+            return
+        self.committed_text.extend(segment.text for segment in ready)
+        self.committed_pos += int(ready[-1].end * self.rate)
+
+    def close(self, end_pos):
+        """Capture is over: stop decoding windows. ``end_pos`` is the final sample count."""
+        self.end_pos = end_pos
+        self._stop.set()
+
+    def cancel(self):
+        self._stop.set()
+
+    def finish(self, audio, trace=None):
+        """Decode the uncommitted tail of the final clip and return the full text."""
+        self._stop.set()
+        self._thread.join()
+        end_pos = self.end_pos if self.end_pos is not None else audio.size
+        offset = end_pos - audio.size
+        tail = audio[max(0, self.committed_pos - offset):]
+        parts = list(self.committed_text)
+        speech = self.transcriber.gate_silence(tail, trace) if tail.size else None
+        if speech is not None:
+            segments = self.transcriber.transcribe_segments(speech, trace=trace, dictation=True)
+            if segments is None and not parts:
                 return None
+            parts.extend(segment.text for segment in segments or [])
+        log(
+            f"Streaming: {self.committed_pos / self.rate:.1f}s committed while recording, "
+            f"{tail.size / self.rate:.1f}s tail decoded at stop."
+        )
+        return "".join(parts).strip()
+
+
+class ChunkedSession:
+    """Long-recording pipeline: cut the capture at pauses, decode chunk by chunk.
+
+    Once MIN_CHUNK_SECONDS have piled up past the last cut, the capture is
+    cut in the latest pause and the audio before it is decoded as one chunk.
+    The recorder's ring buffer then reuses that audio, so memory depends on
+    CHUNK_BUFFER_SECONDS, not on the recording length. Chunk texts are joined
+    in capture order; finish() adds the tail left at stop.
+    """
+
+    POLL_SECONDS = 1.0
+    MIN_CHUNK_SECONDS = 15.0
+    MAX_CHUNK_SECONDS = 28.0  # stays inside one 30s Whisper window
+    PAUSE_SECONDS = 0.4
+
+    def __init__(self, transcriber, recorder):
+        self.transcriber = transcriber
+        self.recorder = recorder
+        self.rate = recorder.rate
+        self.cut_pos = 0
+        self.texts = []
+        self.chunks = 0
+        self.lost_samples = 0
+        self.end_pos = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _next_cut(self, pending):
+        """Length of the next chunk in ``pending`` samples, or None to wait for more."""
+        if pending.size < self.MIN_CHUNK_SECONDS * self.rate:
+            return None
+        window = pending[:int(self.MAX_CHUNK_SECONDS * self.rate)]
+        pause = find_pause(
+            window, self.rate, self.PAUSE_SECONDS, self.transcriber.config.get("silence_gate_dbfs")
+        )
+        if pause is not None and pause >= self.MIN_CHUNK_SECONDS / 2 * self.rate:
+            return pause
+        if pending.size >= self.MAX_CHUNK_SECONDS * self.rate:
+            return window.size  # no pause: cut mid-speech rather than fall behind
+        return None
+
+    def _loop(self):
+        while not self._stop.wait(self.POLL_SECONDS):
+            taken = self.recorder.snapshot_from(self.cut_pos)
+            if taken is None:
+                continue
+            first, pending = taken
+            if first > self.cut_pos:
+                # Decoding fell more than CHUNK_BUFFER_SECONDS behind capture.
+                lost = first - self.cut_pos
+                self.lost_samples += lost
+                log_error(f"Chunked recording: {lost / self.rate:.1f}s overwritten before decode.")
+                self.cut_pos = first
+            cut = self._next_cut(pending)
+            while cut is not None and not self._stop.is_set():
+                self._decode_chunk(pending[:cut])
+                self.cut_pos += cut
+                pending = pending[cut:]
+                cut = self._next_cut(pending)
+
+    def _decode_chunk(self, chunk, trace=None):
+        started = time.monotonic()
+        text = self.transcriber.transcribe(chunk, trace, dictation=True)
+        if text:
+            self.texts.append(text)
+        self.chunks += 1
+        log(
+            f"Chunked recording: chunk {self.chunks} ({chunk.size / self.rate:.1f}s) "
+            f"decoded in {time.monotonic() - started:.2f}s."
+        )
+        return text
+
+    def close(self, end_pos):
+        """Capture is over: stop cutting chunks. ``end_pos`` is the final sample count."""
+        self.end_pos = end_pos
+        self._stop.set()
+
+    def cancel(self):
+        self._stop.set()
+
+    def finish(self, audio, trace=None):
+        """Decode what is left after the last cut and return the stitched text."""
+        self._stop.set()
+        self._thread.join()
+        end_pos = self.end_pos if self.end_pos is not None else audio.size
+        offset = end_pos - audio.size
+        if self.cut_pos < offset:
+            self.lost_samples += offset - self.cut_pos  # overwritten before the stop
+        tail = audio[max(0, self.cut_pos - offset):]
+        text = self._decode_chunk(tail, trace) if tail.size else ""
+        if text is None and not self.texts:
+            return None
+        log(
+            f"Chunked recording: {self.chunks} chunk(s), {end_pos / self.rate:.1f}s total, "
+            f"{tail.size / self.rate:.1f}s tail decoded at stop"
+            + (f", {self.lost_samples / self.rate:.1f}s lost" if self.lost_samples else "")
+            + "."
+        )
+        return " ".join(self.texts).strip()
 
-        with self._transcribe_lock:
-            try:
-                log("Starting transcription...")
-                lang = self.config.get("language")
-                if lang == "auto":
-                    lang = None
-                profile = self.config.get("transcription_profile") or "fast"
-                preset = PROFILE_PRESETS.get(profile, PROFILE_PRESETS["fast"])
-
-                segments, _info = self.model.transcribe(
-                    audio_path,
-                    beam_size=preset["beam_size"],
-                    best_of=preset["best_of"],
-                    language=lang,
-                    condition_on_previous_text=preset["condition_on_previous_text"],
-                    vad_filter=preset["vad_filter"],
-                    vad_parameters=preset["vad_parameters"],
-                    no_speech_threshold=preset["no_speech_threshold"],
-                    log_prob_threshold=preset["log_prob_threshold"],
+
+# ==================================================================================
+# LATENCY INSTRUMENTATION
+# ==================================================================================
+
+LATENCY_FILE = os.path.join(APP_DIR, "latency_CyberScribe.jsonl")
+# Stages reported in the tray summary, in pipeline order.
+LATENCY_STAGES = (
+    "start_latency", "stop_latency", "finalize", "queue_wait", "model_wait",
+    "vad", "language", "decode", "cascade", "paste", "total",
+)
+
+
+class DictationTrace:
+    """Monotonic timings for one dictation, hotkey to paste. Never holds text.
+
+    ``marks`` are points in time (hotkey_start, record_start, hotkey_stop,
+    record_stop, finalized, pasted); ``spans`` accumulate durations measured
+    by the worker (queue_wait, model_wait, vad, language, decode, cascade, paste).
+    """
+
+    def __init__(self, hotkey_at=None):
+        self.marks = {"hotkey_start": hotkey_at or time.monotonic()}
+        self.spans = {}
+        self.audio_seconds = 0.0
+        self.outcome = None
+
+    def mark(self, name, at=None):
+        self.marks[name] = at or time.monotonic()
+
+    def add(self, stage, seconds):
+        self.spans[stage] = self.spans.get(stage, 0.0) + seconds
+
+    def _between(self, start, end):
+        if start in self.marks and end in self.marks:
+            return self.marks[end] - self.marks[start]
+        return None
+
+    def durations(self):
+        """{stage: seconds} for every stage this trace can account for."""
+        derived = {
+            "start_latency": self._between("hotkey_start", "record_start"),
+            "recording": self._between("record_start", "record_stop"),
+            "stop_latency": self._between("hotkey_stop", "record_stop"),
+            "finalize": self._between("record_stop", "finalized"),
+            "total": self._between("hotkey_stop", "pasted"),
+        }
+        result = {k: v for k, v in derived.items() if v is not None}
+        result.update(self.spans)
+        return result
+
+    def to_record(self):
+        return {
+            "ts": round(time.time(), 3),
+            "audio_seconds": round(self.audio_seconds, 3),
+            "outcome": self.outcome,
+            "ms": {k: round(v * 1000, 1) for k, v in self.durations().items()},
+        }
+
+
+class LatencyStats:
+    """Rolling per-stage latency percentiles over the last ``window`` dictations."""
+
+    def __init__(self, window=200):
+        self.records = collections.deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, trace):
+        record = trace.to_record()
+        with self._lock:
+            self.records.append(record)
+        spans = ", ".join(f"{k} {v:.0f}" for k, v in record["ms"].items())
+        log(f"Dictation latency (ms, {record['audio_seconds']:.1f}s audio): {spans}")
+
+    @staticmethod
+    def _percentile(values, pct):
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self):
+        """{stage: (p50_ms, p95_ms, samples)} over the retained window."""
+        with self._lock:
+            records = list(self.records)
+        result = {}
+        for stage in LATENCY_STAGES:
+            values = [r["ms"][stage] for r in records if stage in r["ms"]]
+            if values:
+                result[stage] = (
+                    self._percentile(values, 50), self._percentile(values, 95), len(values)
                 )
-                text_result = "".join([segment.text for segment in segments]).strip()
-                log(f"Transcription finished. ({len(text_result)} chars)")
-                return text_result
+        return result
+
+    def format_summary(self):
+        summary = self.summary()
+        if not summary:
+            return "Aucune dictée mesurée."
+        return "\n".join(
+            f"{stage}: p50 {p50:.0f} ms / p95 {p95:.0f} ms" for stage, (p50, p95, _n) in summary.items()
+        )
+
+    def dump(self, path=LATENCY_FILE):
+        """Write the retained records as JSONL; returns how many."""
+        with self._lock:
+            records = list(self.records)
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        return len(records)
+
+
+# ==================================================================================
+# TEXT INJECTION
+# ==================================================================================
+
+# Clipboard paste waits for the clipboard to really hold the text (instead of
+# a fixed sleep), then restores the user's clipboard once the target app has
+# had time to read it.
+CLIPBOARD_CONFIRM_TIMEOUT = 0.25
+CLIPBOARD_POLL_SECONDS = 0.005
+CLIPBOARD_RESTORE_DELAY = 0.4
+
+
+class SystemInjectionBackend:
+    """The real clipboard (pyperclip) and keyboard (pynput, pyautogui fallback)."""
+
+    def get_clipboard(self):
+        return pyperclip.paste()
+
+    def set_clipboard(self, text):
+        pyperclip.copy(text)
+
+    def send_paste(self):
+        try:
+            controller = keyboard.Controller()
+            with controller.pressed(keyboard.Key.ctrl):
+                controller.press("v")
+                controller.release("v")
+        except Exception as e:
+            log_error(f"Error sending paste chord: {e}")
+            log("Retrying with pyautogui...")
+            pyautogui.hotkey("ctrl", "v")
+
+    def type_text(self, text):
+        keyboard.Controller().type(text)
+
+
+class MemoryInjectionBackend:
+    """In-process stand-in for the clipboard and keyboard.
+
+    Whatever a focused window would have received is appended to
+    ``received``. ``clipboard_lag`` delays clipboard writes the way a slow
+    clipboard owner does, so the confirm wait can be checked headless.
+    """
+
+    def __init__(self, clipboard="", clipboard_lag=0.0):
+        self.received = []
+        self.clipboard_lag = clipboard_lag
+        self._clipboard = clipboard
+        self._pending = None  # (visible_at, text)
+        self._lock = threading.Lock()
+
+    def get_clipboard(self):
+        with self._lock:
+            if self._pending and time.monotonic() >= self._pending[0]:
+                self._clipboard = self._pending[1]
+                self._pending = None
+            return self._clipboard
+
+    def set_clipboard(self, text):
+        with self._lock:
+            self._pending = (time.monotonic() + self.clipboard_lag, text)
+
+    def send_paste(self):
+        self.received.append(self.get_clipboard())
+
+    def type_text(self, text):
+        self.received.append(text)
+
+
+class TextInjector:
+    """Puts dictated text into the focused window.
+
+    ``injection_mode``: "type" sends keystrokes, "paste" goes through the
+    clipboard, "auto" types texts up to ``type_max_chars`` and pastes longer
+    ones. A failed strategy falls back to the other one.
+    """
+
+    def __init__(self, config, backend=None):
+        self.config = config
+        self.backend = backend or SystemInjectionBackend()
+        self._saved = None  # user clipboard awaiting restore
+        self._restore_timer = None
+        self._restore_seq = 0  # identifies the pending restore
+        self._lock = threading.Lock()
+
+    def _strategies(self, text):
+        mode = self.config.get("injection_mode")
+        short = len(text) <= self.config.get("type_max_chars") and "\n" not in text
+        if mode == "type" or (mode == "auto" and short):
+            return [("type", self._type), ("paste", self._paste)]
+        return [("paste", self._paste), ("type", self._type)]
+
+    def inject(self, text):
+        """Inject ``text``; returns the name of the strategy that worked, or None."""
+        for name, strategy in self._strategies(text):
+            started = time.monotonic()
+            try:
+                detail = strategy(text)
             except Exception as e:
-                log_error(f"Transcription error: {e}")
-                return None
+                log_error(f"Text injection via {name} failed: {e}")
+                continue
+            elapsed = (time.monotonic() - started) * 1000
+            log(f"Text injected via {name} in {elapsed:.0f} ms{detail or ''}.")
+            return name
+        return None
+
+    def _type(self, text):
+        self.backend.type_text(text)
+
+    def _paste(self, text):
+        with self._lock:
+            if self._restore_timer is not None:
+                # Previous paste not restored yet: _saved still holds the
+                # user's clipboard, not our last dictation.
+                self._restore_timer.cancel()
+                self._restore_timer = None
+            elif self.config.get("restore_clipboard"):
+                self._saved = self.backend.get_clipboard()
+        self.backend.set_clipboard(text)
+        confirm_started = time.monotonic()
+        deadline = confirm_started + CLIPBOARD_CONFIRM_TIMEOUT
+        confirmed = self.backend.get_clipboard() == text
+        while not confirmed and time.monotonic() < deadline:
+            time.sleep(CLIPBOARD_POLL_SECONDS)
+            confirmed = self.backend.get_clipboard() == text
+        waited = (time.monotonic() - confirm_started) * 1000
+        if not confirmed:
+            # Pasting now could drop the previous clipboard into the window.
+            with self._lock:
+                self._saved = None
+            raise RuntimeError(f"clipboard not updated after {waited:.0f} ms")
+        self.backend.send_paste()
+        self._schedule_restore(text)
+        return f" (clipboard confirmed in {waited:.0f} ms)"
+
+    def _schedule_restore(self, text):
+        with self._lock:
+            if not self.config.get("restore_clipboard") or not self._saved:
+                # Nothing to restore, or non-text content pyperclip can't round-trip.
+                self._saved = None
+                return
+            self._restore_seq += 1
+            timer = threading.Timer(
+                CLIPBOARD_RESTORE_DELAY, self._restore, args=(text, self._restore_seq)
+            )
+            timer.daemon = True
+            self._restore_timer = timer
+        timer.start()
+
+    def _restore(self, text, seq):
+        with self._lock:
+            if seq != self._restore_seq or self._restore_timer is None:
+                return  # superseded by a newer paste, or already restored
+            saved, self._saved = self._saved, None
+            self._restore_timer = None
+        try:
+            # Leave the clipboard alone if the user copied something meanwhile.
+            if saved and self.backend.get_clipboard() == text:
+                self.backend.set_clipboard(saved)
+        except Exception as e:
+            log_error(f"Clipboard restore failed: {e}")
+
+    def flush(self):
+        """Restore the clipboard now if a restore is pending (used on exit)."""
+        with self._lock:
+            timer = self._restore_timer
+        if timer is not None:
+            timer.cancel()
+            self._restore(*timer.args)
+
+
+# ==================================================================================
+# TRANSCRIPTION QUEUE
+# ==================================================================================
+
+class TranscriptionJob:
+    def __init__(self, seq, fn, audio_seconds=0.0, trace=None):
+        self.seq = seq
+        self.fn = fn
+        self.audio_seconds = audio_seconds
+        self.trace = trace
+        self.enqueued_at = time.monotonic()
+
+
+class TranscriptionScheduler:
+    """Bounded FIFO of dictation jobs served by worker threads.
+
+    When the queue is full the oldest waiting job is dropped in favour of the
+    new one. Results reach ``deliver(job, text)`` in submission order, even if
+    several workers finish out of order; dropped jobs are skipped.
+    """
+
+    _DROPPED = object()
+
+    def __init__(self, deliver, workers=1, max_depth=3):
+        self.deliver = deliver
+        self._pending = collections.deque()
+        self._results = {}
+        self._next_seq = 0
+        self._deliver_seq = 0
+        self._cond = threading.Condition()
+        self._deliver_lock = threading.Lock()
+        self._running = True
+        self._workers = 0
+        self._target_workers = 0
+        self.resize(workers, max_depth)
+
+    def resize(self, workers, max_depth):
+        """Apply new worker and depth limits; running jobs are not interrupted.
+
+        Surplus workers exit once idle. Jobs beyond the new depth are dropped,
+        oldest first.
+        """
+        workers = max(1, int(workers))
+        with self._cond:
+            self.max_depth = max(1, int(max_depth))
+            dropped = []
+            while len(self._pending) > self.max_depth:
+                job = self._pending.popleft()
+                self._results[job.seq] = self._DROPPED
+                dropped.append(job.seq)
+            self._target_workers = workers
+            spawn = max(0, workers - self._workers)
+            self._workers += spawn
+            self._cond.notify_all()
+        for _ in range(spawn):
+            threading.Thread(target=self._work, daemon=True).start()
+        if dropped:
+            log(f"Transcription queue shrunk: dropped stale job(s) {dropped}.")
+            self._flush()
+
+    def submit(self, fn, audio_seconds=0.0, trace=None):
+        """Queue ``fn`` (returns text or None). False if a stale job was dropped."""
+        with self._cond:
+            job = TranscriptionJob(self._next_seq, fn, audio_seconds, trace)
+            self._next_seq += 1
+            dropped = None
+            if len(self._pending) >= self.max_depth:
+                dropped = self._pending.popleft()
+                self._results[dropped.seq] = self._DROPPED
+            self._pending.append(job)
+            depth = len(self._pending)
+            self._cond.notify()
+        log(f"Transcription #{job.seq} queued (depth {depth}/{self.max_depth}).")
+        if dropped:
+            log(f"Transcription queue full: dropped stale job #{dropped.seq}.")
+            self._flush()
+        return dropped is None
+
+    def depth(self):
+        with self._cond:
+            return len(self._pending)
+
+    def cancel_pending(self):
+        """Drop every job that has not started yet; returns how many."""
+        with self._cond:
+            jobs = list(self._pending)
+            self._pending.clear()
+            for job in jobs:
+                self._results[job.seq] = self._DROPPED
+        if jobs:
+            log(f"Cancelled {len(jobs)} queued transcription(s).")
+            self._flush()
+        return len(jobs)
+
+    def shutdown(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while (
+                    self._running
+                    and not self._pending
+                    and self._workers <= self._target_workers
+                ):
+                    self._cond.wait()
+                if not self._running or self._workers > self._target_workers:
+                    self._workers -= 1
+                    return
+                job = self._pending.popleft()
+                depth = len(self._pending)
+            waited = time.monotonic() - job.enqueued_at
+            if job.trace:
+                job.trace.add("queue_wait", waited)
+            log(
+                f"Transcription #{job.seq} started after {waited * 1000:.0f} ms in queue "
+                f"({depth} still waiting)."
+            )
+            try:
+                result = job.fn()
+            except Exception as e:
+                log_error(f"Transcription job #{job.seq} failed: {e}")
+                result = None
+            with self._cond:
+                self._results[job.seq] = (job, result)
+            self._flush()
+
+    def _flush(self):
+        """Hand finished results to ``deliver`` in submission order."""
+        with self._deliver_lock:
+            while True:
+                with self._cond:
+                    if self._deliver_seq not in self._results:
+                        return
+                    result = self._results.pop(self._deliver_seq)
+                    self._deliver_seq += 1
+                if result is self._DROPPED:
+                    continue
+                try:
+                    self.deliver(*result)
+                except Exception as e:
+                    log_error(f"Transcription delivery failed: {e}")
 
 
 # ==================================================================================
@@ -632,24 +2869,44 @@ class CyberScribeApp:
         self.root.withdraw()
         self.root.title("CyberScribe")
 
+        started = time.perf_counter()
         self.config = ConfigManager()
-        self.recorder = AudioRecorder()
-        self.transcriber = Transcriber(self.config)
+        STARTUP.add("config load", time.perf_counter() - started)
+        self.recorder = AudioRecorder(self.config)
+        self.queue = queue.Queue()
+        self.transcriber = Transcriber(
+            self.config, on_state_change=lambda: self.post("model_state")
+        )
+        self.scheduler = TranscriptionScheduler(
+            self.deliver_transcription,
+            workers=self.config.get("max_concurrent_transcriptions"),
+            max_depth=self.config.get("max_queue_depth"),
+        )
+        self.server = None
+        self.injector = TextInjector(self.config)
         self.is_recording = False
         self.auto_stop_timer = None
+        self._capped_recording = False
+        self.stream_session = None
+        self.trace = None
+        self._hotkey_at = None
+        self.latency = LatencyStats()
         self._running = True
 
         self.overlay = PartialOverlay(self.root)
         self.settings_window = None
 
-        self.icon_gray = get_icon_image(ICON_GRAY_B64)
-        self.icon_red = get_icon_image(ICON_RED_B64)
+        # Built on the tray thread, which is the first to need PIL.
+        self.icon_gray = None
+        self.icon_red = None
 
         self.tray_icon = None
-        self.queue = queue.Queue()
+        self._tray_state = None
         self.hotkey_listener = None
-
-        self.setup_hotkey()
+        self._loop_started = None
+        self._loop_running = False
+        self._wakeups = 0
+        self._applied_config = self.config.snapshot
 
     def setup_hotkey(self):
         if self.hotkey_listener:
@@ -679,14 +2936,27 @@ class CyberScribeApp:
             return False
 
     def on_hotkey_press(self):
+        self._hotkey_at = time.monotonic()
         log("Hotkey detected!")
-        self.queue.put("toggle_recording")
+        self.post("toggle_recording")
+
+    def post(self, msg):
+        """Queue ``msg`` for the Tk thread and wake it; safe from any thread."""
+        self.queue.put(msg)
+        if not self._loop_running:
+            # Picked up by the first drain once mainloop starts.
+            return
+        try:
+            self.root.event_generate(WAKE_EVENT, when="tail")
+        except Exception:
+            pass
 
     def toggle_recording(self):
+        hotkey_at, self._hotkey_at = self._hotkey_at, None
         if self.is_recording:
-            self.stop_recording_action()
+            self.stop_recording_action(hotkey_at)
         else:
-            self.start_recording_action()
+            self.start_recording_action(hotkey_at)
 
     def _beep(self, freq, duration):
         try:
@@ -703,15 +2973,22 @@ class CyberScribeApp:
         except Exception:
             pass
 
-    def start_recording_action(self):
+    def start_recording_action(self, hotkey_at=None):
         log("Action: Start Recording")
+        trace = DictationTrace(hotkey_at)
         if not self.recorder.start():
             self.is_recording = False
             self.update_tray_icon(recording=False)
             self._notify("CyberScribe", "Impossible d'accéder au microphone.")
             return
 
+        trace.mark("record_start")
+        self.trace = trace
         self.is_recording = True
+        if self.config.get("chunked_recording"):
+            self.stream_session = self.transcriber.start_chunked(self.recorder)
+        elif self.config.get("streaming"):
+            self.stream_session = self.transcriber.start_stream(self.recorder)
         self.update_tray_icon(recording=True)
         self._beep(600, 200)
         self.overlay.show()
@@ -721,19 +2998,26 @@ class CyberScribeApp:
             max_seconds = int(max_seconds)
         except Exception:
             max_seconds = 0
+        self._capped_recording = False
+        if max_seconds <= 0 and not self.config.get("chunked_recording"):
+            # "No limit" still has to stop before the capture buffer wraps.
+            max_seconds = MAX_RECORD_SECONDS_CAP
+            self._capped_recording = True
 
         if max_seconds > 0:
             if self.auto_stop_timer:
                 self.auto_stop_timer.cancel()
             self.auto_stop_timer = threading.Timer(
-                max_seconds, lambda: self.queue.put("auto_stop_recording")
+                max_seconds, lambda: self.post("auto_stop_recording")
             )
             self.auto_stop_timer.daemon = True
             self.auto_stop_timer.start()
             log(f"Auto-stop armed at {max_seconds}s.")
 
-    def stop_recording_action(self):
+    def stop_recording_action(self, hotkey_at=None):
         log("Action: Stop Recording")
+        trace, self.trace = self.trace or DictationTrace(hotkey_at), None
+        trace.mark("hotkey_stop", hotkey_at)
         self.is_recording = False
         self.update_tray_icon(recording=False)
 
@@ -744,68 +3028,138 @@ class CyberScribeApp:
         self.overlay.hide()
         self._beep(400, 200)
 
-        audio_path = self.recorder.stop()
-        if audio_path:
-            log("Audio captured.")
-            threading.Thread(target=self.process_audio, args=(audio_path,), daemon=True).start()
+        pcm = self.recorder.stop()
+        trace.mark("record_stop")
+        session, self.stream_session = self.stream_session, None
+        if pcm is None:
+            if session:
+                session.cancel()
+            return
+        if session:
+            session.close(self.recorder.captured_samples())
+        # Convert before the next start() can reuse the capture buffer.
+        audio = pcm16_to_float32(pcm)
+        # In chunked mode ``audio`` is only the end of the ring buffer.
+        captured = self.recorder.captured_samples()
+        audio_seconds = captured / self.recorder.rate
+        if captured > audio.size and not isinstance(session, ChunkedSession):
+            lost = (captured - audio.size) / self.recorder.rate
+            log_error(f"Capture buffer wrapped: first {lost:.1f}s of the recording lost.")
+            self._notify(
+                "CyberScribe",
+                f"Transcription incomplète : les {lost:.1f} premières secondes ont été perdues.",
+            )
+        trace.mark("finalized")
+        trace.audio_seconds = audio_seconds
+        log(f"Audio captured ({audio_seconds:.1f}s).")
+        if not self.scheduler.submit(
+            lambda: self.process_audio(audio, session, trace),
+            audio_seconds=audio_seconds,
+            trace=trace,
+        ):
+            self._notify("CyberScribe", "File pleine : la plus ancienne dictée a été abandonnée.")
 
     def update_tray_icon(self, recording=False, loading=False):
-        if not self.tray_icon:
+        if loading:
+            state = "loading"
+        elif recording:
+            state = "recording"
+        else:
+            state = "ready"
+        if not self.tray_icon or state == self._tray_state:
             return
         try:
-            if loading:
+            if state == "loading":
                 self.tray_icon.icon = self.icon_gray
                 self.tray_icon.title = "CyberScribe - Chargement du modèle..."
-            elif recording:
+            elif state == "recording":
                 self.tray_icon.icon = self.icon_red
                 self.tray_icon.title = "CyberScribe - Enregistrement..."
             else:
                 self.tray_icon.icon = self.icon_gray
                 self.tray_icon.title = f"CyberScribe v{__version__} - Prêt"
+            self._tray_state = state
         except Exception as e:
             log_error(f"Error updating tray: {e}")
 
-    def process_audio(self, audio_path):
+    def refresh_tray_icon(self):
+        """Derive the tray state from the recorder and model (Tk thread)."""
+        model_busy = self.transcriber.loading or not self.transcriber.model
+        self.update_tray_icon(
+            recording=self.is_recording,
+            loading=model_busy and not self.is_recording,
+        )
+
+    def process_audio(self, audio, session=None, trace=None):
         log("Transcribing...")
-        try:
-            text = self.transcriber.transcribe(audio_path)
-        finally:
-            self.recorder._safe_remove(audio_path)
+        if session:
+            text = session.finish(audio, trace)
+            lost = getattr(session, "lost_samples", 0) / self.recorder.rate
+            if lost:
+                self._notify(
+                    "CyberScribe",
+                    f"Transcription incomplète : {lost:.1f} s d'audio perdues "
+                    "(décodage trop lent pendant l'enregistrement).",
+                )
+            return text
+        return self.transcriber.transcribe(audio, trace, dictation=True)
+
+    def deliver_transcription(self, job, text):
+        """Scheduler callback, called in dictation order."""
+        trace = job.trace
+        if trace and "hotkey_stop" in trace.marks:
+            log(
+                f"Stop-to-text: {(time.monotonic() - trace.marks['hotkey_stop']) * 1000:.0f} ms "
+                f"for {job.audio_seconds:.1f}s of audio (job #{job.seq})."
+            )
 
         if text:
             log(f"Transcription result: [Redacted for security] ({len(text)} chars)")
+            started = time.monotonic()
             self.paste_text(text)
+            if trace:
+                trace.add("paste", time.monotonic() - started)
+                trace.outcome = "pasted"
+        elif text == "" and trace and trace.outcome == "silent":
+            log("No speech detected, nothing to paste.")
+            self._notify(
+                "CyberScribe",
+                "Aucune parole détectée. Micro trop faible ? "
+                "Baissez silence_gate_dbfs dans config.json (ex. -65).",
+            )
         else:
             log("No transcription result.")
             self._notify("CyberScribe", "Aucune transcription. Vérifiez le micro ou les logs.")
+            if trace:
+                trace.outcome = "empty" if text == "" else "failed"
+        if trace:
+            trace.mark("pasted")
+            self.latency.record(trace)
 
     def paste_text(self, text):
-        try:
-            log("Attempting to paste text...")
-            pyperclip.copy(text)
-            time.sleep(0.3)
+        if not self.injector.inject(text):
+            log_error("Text injection failed with every strategy.")
 
-            from pynput.keyboard import Controller, Key
-            keyboard_controller = Controller()
+    def request_settings(self, icon, item):
+        self.post("settings")
 
-            with keyboard_controller.pressed(Key.ctrl):
-                keyboard_controller.press("v")
-                keyboard_controller.release("v")
+    def request_cancel_pending(self, icon, item):
+        self.post("cancel_pending")
 
-            log("Paste command sent.")
-        except Exception as e:
-            log_error(f"Error pasting text: {e}")
-            try:
-                log("Retrying with pyautogui...")
-                pyautogui.hotkey("ctrl", "v")
-            except Exception as e2:
-                log_error(f"Fallback paste failed: {e2}")
+    def request_model_residency(self, icon, item):
+        self.post("model_residency")
 
-    def request_settings(self, icon, item):
-        self.queue.put("settings")
+    def request_latency_summary(self, icon, item):
+        self.post("latency_summary")
+
+    def request_latency_dump(self, icon, item):
+        self.post("latency_dump")
+
+    def request_toggle_debug_log(self, icon, item):
+        self.post("toggle_debug_log")
 
     def request_quit(self, icon, item):
-        self.queue.put("quit")
+        self.post("quit")
 
     def open_settings_window(self):
         if self.settings_window and self.settings_window.winfo_exists():
@@ -961,33 +3315,38 @@ class CyberScribeApp:
             ).pack(pady=0)
 
             create_label(">> COMPUTE TYPE").pack(pady=(12, 2))
-            create_help_text("Precision: int8 (fast) / float16 (GPU) / float32 (quality)").pack(
-                pady=(0, 4)
-            )
-            compute_var = tk.StringVar(root, value=self.config.get("compute_type") or "int8")
+            create_help_text(
+                "Precision: auto (fastest measured) / int8 (fast) / float16 (GPU) / float32"
+            ).pack(pady=(0, 4))
+            compute_var = tk.StringVar(root, value=self.config.get("compute_type") or "auto")
             ttk.Combobox(
                 main_frame,
                 textvariable=compute_var,
-                values=["int8", "int8_float16", "float16", "float32"],
+                values=["auto", "int8", "int8_float16", "float16", "float32"],
                 font=("Consolas", 10),
             ).pack(pady=0)
 
             create_label(">> TRANSCRIPTION PROFILE").pack(pady=(12, 2))
-            create_help_text("fast = low latency, balanced = compromise, accurate = quality").pack(
-                pady=(0, 4)
-            )
+            create_help_text(
+                "fast = low latency, balanced = compromise, accurate = quality, auto = calibrated"
+            ).pack(pady=(0, 4))
             profile_var = tk.StringVar(root, value=self.config.get("transcription_profile") or "fast")
             ttk.Combobox(
                 main_frame,
                 textvariable=profile_var,
-                values=["fast", "balanced", "accurate"],
+                values=["fast", "balanced", "accurate", "auto"],
                 font=("Consolas", 10),
             ).pack(pady=0)
 
+            create_label(">> LATENCY TARGET (MS)").pack(pady=(12, 2))
+            create_help_text("Auto profile: max decode time for a 10s dictation").pack(pady=(0, 4))
+            latency_var = tk.StringVar(root, value=str(self.config.get("latency_target_ms")))
+            create_entry(latency_var).pack(pady=0, ipadx=5, ipady=3)
+
             create_label(">> MAX RECORD DURATION (SECONDS)").pack(pady=(12, 2))
-            create_help_text("Auto-stop safety. 0 disables limit. Recommended: 15-30s").pack(
-                pady=(0, 4)
-            )
+            create_help_text(
+                "Auto-stop safety. 0 = 10 min cap (none if chunked). Recommended: 15-30s"
+            ).pack(pady=(0, 4))
             max_record_var = tk.StringVar(root, value=str(self.config.get("max_record_seconds") or 25))
             create_entry(max_record_var).pack(pady=0, ipadx=5, ipady=3)
 
@@ -1006,7 +3365,7 @@ class CyberScribeApp:
             ).pack(pady=0, fill="x", padx=30)
 
             def test_rec():
-                self.queue.put("toggle_recording")
+                self.post("toggle_recording")
 
             tk.Button(
                 main_frame,
@@ -1019,14 +3378,14 @@ class CyberScribeApp:
             ).pack(pady=(24, 5), ipadx=10)
 
             def save():
-                old_model = self.config.get("model_size")
-                old_device = self.config.get("device")
-                old_compute = self.config.get("compute_type")
-
                 try:
                     max_record = int(max_record_var.get())
                 except Exception:
                     max_record = DEFAULT_CONFIG["max_record_seconds"]
+                try:
+                    latency_target = int(latency_var.get())
+                except Exception:
+                    latency_target = DEFAULT_CONFIG["latency_target_ms"]
 
                 self.config.update({
                     "hotkey": hk_var.get(),
@@ -1036,6 +3395,7 @@ class CyberScribeApp:
                     "compute_type": compute_var.get(),
                     "transcription_profile": profile_var.get() or "fast",
                     "max_record_seconds": max_record,
+                    "latency_target_ms": latency_target,
                 })
                 if not self.setup_hotkey():
                     messagebox.showwarning(
@@ -1044,14 +3404,7 @@ class CyberScribeApp:
                         parent=root,
                     )
 
-                model_changed = (
-                    self.config.get("model_size") != old_model
-                    or self.config.get("device") != old_device
-                    or self.config.get("compute_type") != old_compute
-                )
-                if model_changed:
-                    self.transcriber.reload()
-                    self.update_tray_icon(loading=True)
+                if self.apply_config_change(rebind_hotkey=False):
                     messagebox.showinfo(
                         "CyberScribe",
                         "Configuration enregistrée.\nLe modèle Whisper se recharge en arrière-plan.",
@@ -1104,60 +3457,227 @@ class CyberScribeApp:
                 bg="#1f2937",
                 fg="#d1d5db",
             ).pack(pady=(0, 18))
+            splash.update()
+            STARTUP.milestone("splash visible")
             self.root.after(3000, splash.destroy)
         except Exception as e:
             log_error(f"Splash error: {e}")
 
+    def _on_tray_ready(self, icon):
+        icon.visible = True
+        elapsed = STARTUP.milestone("tray visible")
+        budget = "within" if elapsed <= STARTUP_BUDGET_SECONDS else "OVER"
+        log(f"Tray visible {elapsed:.2f}s after launch ({budget} {STARTUP_BUDGET_SECONDS:.1f}s budget).")
+        self.post("model_state")
+
     def run_tray(self):
+        self.icon_gray = get_icon_image(ICON_GRAY_B64)
+        self.icon_red = get_icon_image(ICON_RED_B64)
         menu = pystray.Menu(
             pystray.MenuItem("Configuration", self.request_settings),
+            pystray.MenuItem("Annuler les transcriptions en attente", self.request_cancel_pending),
+            pystray.MenuItem("Modèles en mémoire", self.request_model_residency),
+            pystray.MenuItem("Statistiques de latence", self.request_latency_summary),
+            pystray.MenuItem("Exporter les latences (JSONL)", self.request_latency_dump),
+            pystray.MenuItem(
+                "Journal détaillé (DEBUG)",
+                self.request_toggle_debug_log,
+                checked=lambda item: self.config.get("log_level") == "DEBUG",
+            ),
             pystray.MenuItem("Quitter", self.request_quit),
         )
         self.tray_icon = pystray.Icon(
             "CyberScribe", self.icon_gray, f"CyberScribe v{__version__}", menu
         )
-        self.tray_icon.run()
+        try:
+            self.tray_icon.run(setup=self._on_tray_ready)
+        finally:
+            if self._running:
+                self.post("quit")
 
-    def run(self):
+    def _init_audio(self):
+        cleanup_orphan_temp_files()
+        try:
+            self.recorder.init_audio()
+        except Exception as e:
+            log_error(f"Audio init failed: {e}")
+
+    def apply_config_change(self, rebind_hotkey=True):
+        """Act on settings changed since the last applied snapshot.
+
+        Every key applies without a restart. Returns True when the Whisper
+        model is being reloaded.
+        """
+        old, new = self._applied_config, self.config.snapshot
+        self._applied_config = new
+        if rebind_hotkey and new.hotkey != old.hotkey:
+            self.setup_hotkey()
+        if (
+            new.max_queue_depth != old.max_queue_depth
+            or new.max_concurrent_transcriptions != old.max_concurrent_transcriptions
+        ):
+            self.scheduler.resize(new.max_concurrent_transcriptions, new.max_queue_depth)
+            self.transcriber.resize_decode_slots()
+        if new.model_cache_mb != old.model_cache_mb:
+            self.transcriber.cache.resize(new.model_cache_mb)
+        server_keys = ("server_enabled", "server_port", "server_max_concurrent", "server_max_waiting")
+        if any(new.get(key) != old.get(key) for key in server_keys):
+            self.restart_server()
+        model_keys = (
+            "model_size", "device", "compute_type", "cpu_threads", "num_workers", "reserved_cores",
+            "cascade_enabled", "cascade_model",
+        )
+        if any(new.get(key) != old.get(key) for key in model_keys):
+            self.transcriber.reload()
+            return True
+        if new.transcription_profile == "auto" and (
+            old.transcription_profile != "auto" or new.latency_target_ms != old.latency_target_ms
+        ):
+            # A reload calibrates on its own; otherwise (re)apply here.
+            threading.Thread(target=self.transcriber.calibrate, daemon=True).start()
+        return False
+
+    def start_services(self):
+        """Bring up splash, tray, audio and hotkey; return the tray thread."""
         log(f"=== Application Started v{__version__} ===")
         self.show_splash()
         tray_thread = threading.Thread(target=self.run_tray, daemon=True)
         tray_thread.start()
-        self.update_tray_icon(loading=True)
-        while self._running:
+        threading.Thread(target=self._init_audio, daemon=True).start()
+        self.setup_hotkey()
+        if self.config.get("server_enabled"):
+            self.start_server()
+        self.config.watch(lambda: self.post("config_reloaded"))
+        return tray_thread
+
+    def restart_server(self):
+        """Stop the server if running, then start it again if it is enabled."""
+        if self.server:
             try:
-                try:
-                    self.root.update()
-                except tk.TclError:
-                    break
+                self.server.stop()
+                log("Transcription server stopped.")
+            except Exception as e:
+                log_error(f"Transcription server failed to stop: {e}")
+            self.server = None
+        if self.config.get("server_enabled"):
+            self.start_server()
 
-                try:
-                    msg = self.queue.get(timeout=0.1)
-                except queue.Empty:
-                    if self.transcriber.model and not self.transcriber.loading:
-                        if not self.is_recording:
-                            self.update_tray_icon(loading=False)
-                    if not tray_thread.is_alive():
-                        break
-                    continue
-                if msg == "settings":
-                    self.open_settings_window()
-                elif msg == "toggle_recording":
-                    self.toggle_recording()
-                elif msg == "auto_stop_recording":
-                    if self.is_recording:
-                        self.stop_recording_action()
-                elif msg == "quit":
-                    break
-            except KeyboardInterrupt:
-                break
+    def start_server(self):
+        try:
+            self.server = TranscriptionServer(
+                self.transcriber,
+                self.config.get("server_port"),
+                max_concurrent=self.config.get("server_max_concurrent"),
+                max_waiting=self.config.get("server_max_waiting"),
+            )
+            self.server.start()
+        except Exception as e:
+            log_error(f"Transcription server failed to start: {e}")
+            self.server = None
+
+    def dispatch(self, msg):
+        if msg == "settings":
+            self.open_settings_window()
+        elif msg == "toggle_recording":
+            self.toggle_recording()
+        elif msg == "auto_stop_recording":
+            if self.is_recording:
+                if self._capped_recording:
+                    self._notify(
+                        "CyberScribe",
+                        f"Enregistrement arrêté : limite de {MAX_RECORD_SECONDS_CAP // 60} min atteinte.",
+                    )
+                self.stop_recording_action()
+        elif msg == "model_state":
+            self.refresh_tray_icon()
+        elif msg == "model_residency":
+            entries = self.transcriber.cache.residency()
+            lines = [f"{'/'.join(key)} ~{size:.0f} Mo" for key, size in entries]
+            self._notify("CyberScribe", "\n".join(lines) or "Aucun modèle chargé.")
+            log(f"Model cache: {self.transcriber.cache.describe()}")
+        elif msg == "latency_summary":
+            summary = self.latency.format_summary()
+            log(f"Latency p50/p95: {summary}")
+            self._notify("CyberScribe - Latences", summary)
+        elif msg == "latency_dump":
+            try:
+                count = self.latency.dump()
+                log(f"Latency records written: {count} -> {LATENCY_FILE}")
+                self._notify("CyberScribe", f"{count} mesure(s) exportée(s) :\n{LATENCY_FILE}")
+            except Exception as e:
+                log_error(f"Latency dump failed: {e}")
+        elif msg == "config_reloaded":
+            self.apply_config_change()
+            self.refresh_tray_icon()
+        elif msg == "toggle_debug_log":
+            level = "INFO" if self.config.get("log_level") == "DEBUG" else "DEBUG"
+            self.config.set("log_level", level)
+            apply_log_settings(self.config)
+            log(f"Log level set to {level}.")
+            try:
+                self.tray_icon.update_menu()
+            except Exception:
+                pass
+        elif msg == "cancel_pending":
+            cancelled = self.scheduler.cancel_pending()
+            self._notify("CyberScribe", f"{cancelled} transcription(s) en attente annulée(s).")
+        elif msg == "quit":
+            self.root.quit()
+
+    def _drain_queue(self, event=None):
+        self._loop_running = True
+        self._wakeups += 1
+        while True:
+            try:
+                msg = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                self.dispatch(msg)
+            except Exception as e:
+                log_error(f"Error handling '{msg}': {e}")
+
+    def run(self):
+        self._loop_started = (time.monotonic(), time.process_time())
+        self.start_services()
+        self.root.bind(WAKE_EVENT, self._drain_queue)
+        # Pick up anything posted before the loop was running.
+        self.root.after(0, self._drain_queue)
+        try:
+            self.root.mainloop()
+        except KeyboardInterrupt:
+            pass
         self.stop_app()
 
+    def _log_loop_stats(self):
+        if not self._loop_started:
+            return
+        wall = time.monotonic() - self._loop_started[0]
+        cpu = time.process_time() - self._loop_started[1]
+        if wall > 0:
+            log(
+                f"Main loop: {self._wakeups} wakeups in {wall:.0f}s "
+                f"({self._wakeups / wall:.2f}/s), process CPU {cpu / wall * 100:.2f}%."
+            )
+
     def stop_app(self):
         if not self._running:
             return
         self._running = False
+        self._loop_running = False
         log("Stopping...")
+        self._log_loop_stats()
+        if self.stream_session:
+            self.stream_session.cancel()
+            self.stream_session = None
+        self.scheduler.shutdown()
+        self.injector.flush()
+        self.config.flush()
+        if self.server:
+            try:
+                self.server.stop()
+            except Exception:
+                pass
         if self.is_recording:
             try:
                 self.recorder.stop()
@@ -1193,7 +3713,455 @@ class CyberScribeApp:
             pass
 
 
-if __name__ == "__main__":
+# ==================================================================================
+# LOCAL TRANSCRIPTION SERVER
+# ==================================================================================
+
+SERVER_HOST = "127.0.0.1"
+SERVER_MAX_BODY = (MAX_RECORD_SECONDS_CAP + 10) * SAMPLE_RATE * 4
+
+
+class TranscriptionServer:
+    """Opt-in localhost HTTP service sharing the app's loaded Transcriber.
+
+    POST /transcribe   body: raw mono 16 kHz PCM, s16le (default) or f32le
+                       (?format=f32le); optional ?language=xx.
+                       Requires the header "X-CyberScribe: 1", which browsers
+                       cannot send cross-origin without a preflight we never
+                       answer.
+                       200 {"text", "audio_seconds", "timing": {queue_ms,
+                       decode_ms, total_ms}}; 503 when the queue is full.
+    GET  /health       200 {"model_ready", "active", "waiting", "version"}
+
+    At most ``max_concurrent`` requests decode at once and ``max_waiting``
+    more may wait up to ``wait_timeout`` seconds for a slot. Transcripts are
+    returned to the client only, never logged.
+    """
+
+    def __init__(self, transcriber, port, max_concurrent=1, max_waiting=4, wait_timeout=60):
+        self.transcriber = transcriber
+        self.port = port
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrent))
+        self._counts_lock = threading.Lock()
+        self.active = 0
+        self.waiting = 0
+        self.httpd = None
+
+    def start(self):
+        from http.server import ThreadingHTTPServer
+
+        self.httpd = ThreadingHTTPServer((SERVER_HOST, self.port), self._handler_class())
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        log(f"Transcription server listening on http://{SERVER_HOST}:{self.port}")
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def health(self):
+        with self._counts_lock:
+            return {
+                "model_ready": bool(self.transcriber.model),
+                "active": self.active,
+                "waiting": self.waiting,
+                "version": __version__,
+            }
+
+    def handle_transcribe(self, body, params):
+        """Return (status, payload) for one /transcribe request."""
+        received = time.monotonic()
+        fmt = params.get("format", "s16le")
+        if fmt == "s16le":
+            if len(body) % 2:
+                return 400, {"error": "s16le body must hold whole samples"}
+            audio = pcm16_to_float32(body)
+        elif fmt == "f32le":
+            if len(body) % 4:
+                return 400, {"error": "f32le body must hold whole samples"}
+            audio = np.frombuffer(body, dtype="<f4").astype(np.float32)
+        else:
+            return 400, {"error": f"unsupported format: {fmt}"}
+        overrides = {}
+        language = params.get("language")
+        if language:
+            if language not in VALID_LANGUAGES:
+                return 400, {"error": f"unsupported language: {language}"}
+            overrides["language"] = None if language == "auto" else language
+
+        with self._counts_lock:
+            if self.waiting >= self.max_waiting and self.active > 0:
+                return 503, {"error": "server busy"}
+            self.waiting += 1
+        acquired = self._slots.acquire(timeout=self.wait_timeout)
+        with self._counts_lock:
+            self.waiting -= 1
+            if acquired:
+                self.active += 1
+        if not acquired:
+            return 503, {"error": "timed out waiting for a free slot"}
+        started = time.monotonic()
+        try:
+            text = self.transcriber.transcribe(audio, **overrides)
+        finally:
+            self._slots.release()
+            with self._counts_lock:
+                self.active -= 1
+        finished = time.monotonic()
+        timing = {
+            "queue_ms": round((started - received) * 1000, 1),
+            "decode_ms": round((finished - started) * 1000, 1),
+            "total_ms": round((finished - received) * 1000, 1),
+        }
+        audio_seconds = audio.size / SAMPLE_RATE
+        log(
+            f"Server request: {audio_seconds:.1f}s audio, queue {timing['queue_ms']:.0f} ms, "
+            f"decode {timing['decode_ms']:.0f} ms."
+        )
+        if text is None:
+            return 500, {"error": "transcription failed", "timing": timing}
+        return 200, {"text": text, "audio_seconds": audio_seconds, "timing": timing}
+
+    def _handler_class(self):
+        from http.server import BaseHTTPRequestHandler
+        from urllib.parse import parse_qsl, urlsplit
+
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            server_version = f"CyberScribe/{__version__}"
+
+            def _reply(self, status, payload):
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if urlsplit(self.path).path == "/health":
+                    self._reply(200, service.health())
+                else:
+                    self._reply(404, {"error": "not found"})
+
+            def do_POST(self):
+                url = urlsplit(self.path)
+                if url.path != "/transcribe":
+                    self._reply(404, {"error": "not found"})
+                    return
+                if self.headers.get("X-CyberScribe") != "1":
+                    self._reply(403, {"error": "missing X-CyberScribe header"})
+                    return
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                except ValueError:
+                    length = -1
+                if length <= 0 or length > SERVER_MAX_BODY:
+                    self._reply(413 if length > 0 else 411, {"error": "bad Content-Length"})
+                    return
+                body = self.rfile.read(length)
+                try:
+                    status, payload = service.handle_transcribe(body, dict(parse_qsl(url.query)))
+                except Exception as e:
+                    log_error(f"Server error: {e}")
+                    status, payload = 500, {"error": "internal error"}
+                self._reply(status, payload)
+
+            def log_message(self, fmt, *args):
+                logging.debug("server: " + fmt, *args)
+
+        return Handler
+
+
+def transcribe_via_server(audio, port=None, language=None, timeout=300):
+    """Client helper: send float32 samples to a running server, return its JSON reply."""
+    import http.client
+
+    port = port or DEFAULT_CONFIG["server_port"]
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+    path = "/transcribe" + (f"?language={language}" if language else "")
+    conn = http.client.HTTPConnection(SERVER_HOST, port, timeout=timeout)
+    try:
+        conn.request(
+            "POST", path, body=pcm,
+            headers={"X-CyberScribe": "1", "Content-Type": "application/octet-stream"},
+        )
+        response = conn.getresponse()
+        return response.status, json.loads(response.read().decode("utf-8"))
+    finally:
+        conn.close()
+
+
+def server_main(argv):
+    """`serve`: run the server without the tray; `client <file>`: query one."""
+    import argparse
+
+    config = ConfigManager()
+    parser = argparse.ArgumentParser(prog="CyberScribe.py serve|client")
+    parser.add_argument("mode", choices=["serve", "client"])
+    parser.add_argument("files", nargs="*", help="client: audio files to send")
+    parser.add_argument("--port", type=int, default=config.get("server_port"))
+    parser.add_argument("--language", choices=sorted(VALID_LANGUAGES))
+    args = parser.parse_args(argv)
+
+    if args.mode == "client":
+        status = 0
+        for path in args.files:
+            code, reply = transcribe_via_server(
+                faster_whisper.decode_audio(path, sampling_rate=SAMPLE_RATE),
+                port=args.port,
+                language=args.language,
+            )
+            _safe_print(json.dumps(dict(reply, file=path, status=code), ensure_ascii=False))
+            status = status or (0 if code == 200 else 1)
+        return status
+
+    transcriber = Transcriber(config)
+    server = TranscriptionServer(
+        transcriber,
+        args.port,
+        max_concurrent=config.get("server_max_concurrent"),
+        max_waiting=config.get("server_max_waiting"),
+    )
+    server.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    server.stop()
+    return 0
+
+
+# ==================================================================================
+# HEADLESS BATCH MODE  (python CyberScribe.py transcribe <files/dirs>)
+# ==================================================================================
+
+AUDIO_EXTENSIONS = {
+    ".wav", ".mp3", ".m4a", ".flac", ".ogg", ".opus", ".aac", ".wma", ".webm", ".mp4", ".mkv",
+}
+
+
+def collect_audio_files(paths):
+    """Expand files and directories (recursively) into a sorted list of audio files."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _dirs, files in os.walk(path):
+                for name in files:
+                    if os.path.splitext(name)[1].lower() in AUDIO_EXTENSIONS:
+                        found.append(os.path.join(root, name))
+        elif os.path.isfile(path):
+            found.append(path)
+        else:
+            log_error(f"Not found: {path}")
+    return sorted(dict.fromkeys(found))
+
+
+class BatchTranscriber:
+    """Bulk transcription through faster-whisper's BatchedInferencePipeline.
+
+    Shares the tray app's config and PROFILE_PRESETS. ``num_workers`` files
+    are decoded concurrently on one model; ``cpu_threads`` is per worker.
+    """
+
+    def __init__(self, config, batch_size=8, cpu_threads=0, num_workers=1,
+                 formats=("txt", "json"), output_dir=None, overwrite=False):
+        self.config = config
+        self.batch_size = max(1, batch_size)
+        self.cpu_threads, self.num_workers = resolve_thread_budget(
+            config, cpu_threads, num_workers
+        )
+        self.formats = set(formats)
+        self.output_dir = output_dir
+        self.overwrite = overwrite
+        self.pipeline = None
+        self.key = None  # (model_size, device, compute_type, layout), as Transcriber
+        self.profile = None
+
+    def load(self):
+        self.key = resolve_model_target(self.config) + (
+            thread_layout(self.cpu_threads, self.num_workers),
+        )
+        model_size, device, compute_type, _layout = self.key
+        if self.config.get("transcription_profile") == "auto":
+            self.profile = calibrated_profile(self.key, self.config)
+            if "/".join(self.key) not in load_calibration():
+                log(f"No calibration for {'/'.join(self.key)}, profile auto decodes as fast.")
+            else:
+                log(f"Profile auto: {self.profile} (calibrated for {'/'.join(self.key)}).")
+        log(
+            f"Loading Whisper Model ({model_size}) on {device} ({compute_type}), "
+            f"{self.num_workers} worker(s) x {self.cpu_threads or 'default'} thread(s)..."
+        )
+        started = time.monotonic()
+        model = faster_whisper.WhisperModel(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=self.num_workers,
+            download_root=MODELS_DIR,
+        )
+        self.pipeline = faster_whisper.BatchedInferencePipeline(model=model)
+        log(f"Model loaded in {time.monotonic() - started:.2f}s.")
+
+    def _sidecar(self, path, ext):
+        base = os.path.splitext(os.path.basename(path))[0] + "." + ext
+        return os.path.join(self.output_dir or os.path.dirname(path), base)
+
+    def transcribe_file(self, path):
+        """Transcribe one file and write its sidecars; returns (audio_s, wall_s) or None."""
+        targets = [self._sidecar(path, ext) for ext in sorted(self.formats)]
+        if not self.overwrite and all(os.path.exists(t) for t in targets):
+            log(f"Skipping {os.path.basename(path)} (sidecars exist).")
+            return None
+        options = preset_decode_options(self.config, self.profile)
+        options["vad_filter"] = True  # the batched pipeline chunks on VAD
+        started = time.monotonic()
+        segments, info = self.pipeline.transcribe(path, batch_size=self.batch_size, **options)
+        segments = list(segments)
+        wall = time.monotonic() - started
+        text = "".join(segment.text for segment in segments).strip()
+
+        if "txt" in self.formats:
+            with open(self._sidecar(path, "txt"), "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        if "json" in self.formats:
+            data = {
+                "file": os.path.basename(path),
+                "language": info.language,
+                "language_probability": info.language_probability,
+                "duration": info.duration,
+                "model": self.config.get("model_size"),
+                "profile": self.config.get("transcription_profile"),
+                "text": text,
+                "segments": [
+                    {
+                        "start": round(segment.start, 3),
+                        "end": round(segment.end, 3),
+                        "text": segment.text,
+                        "avg_logprob": segment.avg_logprob,
+                        "no_speech_prob": segment.no_speech_prob,
+                    }
+                    for segment in segments
+                ],
+            }
+            with open(self._sidecar(path, "json"), "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
+        rtf = wall / info.duration if info.duration else 0.0
+        log(f"{os.path.basename(path)}: {info.duration:.1f}s audio in {wall:.1f}s (RTF {rtf:.3f}).")
+        return info.duration, wall
+
+    def run(self, files):
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+        started = time.monotonic()
+        done, failed, audio_total = 0, 0, 0.0
+
+        def _one(path):
+            try:
+                return self.transcribe_file(path)
+            except Exception as e:
+                log_error(f"{os.path.basename(path)}: {e}")
+                return False
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=self.num_workers) as pool:
+            for result in pool.map(_one, files):
+                if result is False:
+                    failed += 1
+                elif result:
+                    done += 1
+                    audio_total += result[0]
+
+        wall = time.monotonic() - started
+        files_per_hour = done / wall * 3600 if wall > 0 else 0.0
+        rtf = wall / audio_total if audio_total else 0.0
+        log(
+            f"Batch done: {done} transcribed, {failed} failed, {len(files) - done - failed} skipped "
+            f"in {wall:.1f}s — {files_per_hour:.0f} files/hour, "
+            f"{audio_total / 3600:.2f} h of audio, overall RTF {rtf:.3f}."
+        )
+        return failed == 0
+
+
+def batch_main(argv):
+    import argparse
+
+    config = ConfigManager()
+    parser = argparse.ArgumentParser(
+        prog="CyberScribe.py transcribe",
+        description="Transcribe audio files without the tray app (writes .txt/.json sidecars).",
+    )
+    parser.add_argument("paths", nargs="+", help="audio files or directories (recursive)")
+    parser.add_argument("--model", choices=sorted(VALID_MODELS), default=config.get("model_size"))
+    parser.add_argument("--device", choices=sorted(VALID_DEVICES), default=config.get("device"))
+    parser.add_argument(
+        "--compute-type", choices=sorted(VALID_COMPUTE), default=config.get("compute_type")
+    )
+    parser.add_argument("--language", choices=sorted(VALID_LANGUAGES), default=config.get("language"))
+    parser.add_argument(
+        "--profile", choices=sorted(VALID_PROFILES), default=config.get("transcription_profile")
+    )
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument(
+        "--cpu-threads",
+        type=int,
+        default=config.get("cpu_threads"),
+        help="per worker; 0 = CTranslate2 default (4), -1 = (cores - reserved_cores) / workers",
+    )
+    parser.add_argument("--num-workers", type=int, default=1, help="files decoded in parallel")
+    parser.add_argument("--format", nargs="+", choices=["txt", "json"], default=["txt", "json"])
+    parser.add_argument("--output-dir", help="write sidecars here instead of next to each file")
+    parser.add_argument("--overwrite", action="store_true", help="redo files that have sidecars")
+    args = parser.parse_args(argv)
+
+    run_config = sanitize_config(dict(
+        config.config,
+        model_size=args.model,
+        device=args.device,
+        compute_type=args.compute_type,
+        language=args.language,
+        transcription_profile=args.profile,
+    ))
+    files = collect_audio_files(args.paths)
+    if not files:
+        log_error("No audio files found.")
+        return 2
+    log(f"=== CyberScribe v{__version__} batch: {len(files)} file(s) ===")
+    batch = BatchTranscriber(
+        run_config,
+        batch_size=args.batch_size,
+        cpu_threads=args.cpu_threads,
+        num_workers=args.num_workers,
+        formats=args.format,
+        output_dir=args.output_dir,
+        overwrite=args.overwrite,
+    )
+    batch.load()
+    return 0 if batch.run(files) else 1
+
+
+STARTUP.add("module import", time.perf_counter() - _MODULE_STARTED)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "transcribe":
+        _check_dependencies(("numpy", "faster_whisper"))
+        return batch_main(argv[1:])
+    if argv and argv[0] in ("serve", "client"):
+        _check_dependencies(("numpy", "faster_whisper"))
+        return server_main(argv)
+
+    _check_dependencies()
     instance_handle = _acquire_single_instance()
     if instance_handle is None:
         _message_box(
@@ -1201,7 +4169,11 @@ if __name__ == "__main__":
             "CyberScribe est déjà en cours d'exécution.",
             0x40,
         )
-        sys.exit(0)
+        return 0
     app = CyberScribeApp()
     app.run()
-    sys.exit(0)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Capture and stop cost: list of bytes chunks vs PcmRingBuffer vs SpillRingBuffer.
+
+Simulates AudioRecorder._record_loop at 16 kHz with 1024-sample reads (each
+read returns a fresh bytes object, as PyAudio does), then the stop() step:
+  list = append under a lock, then b"".join at stop
+  ring = PcmRingBuffer.write under a lock, then a zero-copy view at stop
+  spill = the same over a memory-mapped temp file ("capture_backend": "spill");
+          its samples are outside the heap, pages are dropped every ~32 s
+
+Peak heap comes from a separate tracemalloc pass so it does not skew timing.
+
+Usage: python bench/bench_capture.py [--seconds 5 60 600]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from CyberScribe import PcmRingBuffer, SpillRingBuffer  # noqa: E402
+
+RATE = 16000
+CHUNK = 1024
+
+
+def capture_list(template, n_chunks):
+    lock = threading.Lock()
+    frames = []
+    t0 = time.perf_counter()
+    for _ in range(n_chunks):
+        data = bytes(template)
+        with lock:
+            frames.append(data)
+    t1 = time.perf_counter()
+    with lock:
+        pcm = b"".join(frames)
+    t2 = time.perf_counter()
+    return t1 - t0, t2 - t1, len(pcm)
+
+
+def capture_ring(template, n_chunks, buffer_cls=PcmRingBuffer):
+    lock = threading.Lock()
+    ring = buffer_cls(n_chunks * CHUNK)
+    t0 = time.perf_counter()
+    for _ in range(n_chunks):
+        data = bytes(template)
+        with lock:
+            ring.write(data)
+    t1 = time.perf_counter()
+    with lock:
+        pcm = ring.view()
+    t2 = time.perf_counter()
+    nbytes = pcm.nbytes
+    del pcm
+    ring.close()
+    return t1 - t0, t2 - t1, nbytes
+
+
+def capture_spill(template, n_chunks):
+    return capture_ring(template, n_chunks, SpillRingBuffer)
+
+
+def peak_heap(fn, template, n_chunks):
+    tracemalloc.start()
+    fn(template, n_chunks)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=int, nargs="+", default=[5, 60, 600])
+    args = parser.parse_args()
+
+    template = bytearray((np.arange(CHUNK, dtype=np.int16) % 2000).tobytes())
+    print(
+        f"{'clip (s)':>9} {'mode':>5} {'capture (ms)':>13} {'us/chunk':>9} "
+        f"{'stop (ms)':>10} {'peak heap (MB)':>15}"
+    )
+    for seconds in args.seconds:
+        n_chunks = seconds * RATE // CHUNK
+        for name, fn in (("list", capture_list), ("ring", capture_ring), ("spill", capture_spill)):
+            capture, stop, _ = fn(template, n_chunks)
+            peak = peak_heap(fn, template, n_chunks)
+            print(
+                f"{seconds:>9} {name:>5} {capture * 1000:>13.1f} "
+                f"{capture * 1e6 / n_chunks:>9.2f} {stop * 1000:>10.3f} "
+                f"{peak / 1e6:>15.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
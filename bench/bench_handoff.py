@@ -0,0 +1,80 @@
+"""
+Stop-to-model hand-off cost: temp WAV round-trip vs in-memory float32 buffer.
+
+Model time is identical on both paths, so only the hand-off is measured:
+  wav    = join frames, write cyberscribe_*.wav, decode it again (what
+           WhisperModel.transcribe(path) does internally), delete it
+  memory = join frames, int16 view -> float32 (what AudioRecorder.stop() does)
+
+Usage: python bench/bench_handoff.py [--seconds 2 10 30 120] [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from faster_whisper import decode_audio  # noqa: E402
+
+from CyberScribe import pcm16_to_float32  # noqa: E402
+
+RATE = 16000
+CHUNK = 1024
+
+
+def make_frames(seconds, seed=0):
+    rng = np.random.default_rng(seed)
+    pcm = (rng.standard_normal(int(seconds * RATE)) * 3000).astype(np.int16).tobytes()
+    step = CHUNK * 2
+    return [pcm[i:i + step] for i in range(0, len(pcm), step)]
+
+
+def via_wav(frames):
+    fd, path = tempfile.mkstemp(suffix=".wav", prefix="cyberscribe_")
+    os.close(fd)
+    try:
+        with wave.open(path, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(RATE)
+            wf.writeframes(b"".join(frames))
+        return decode_audio(path, sampling_rate=RATE)
+    finally:
+        os.remove(path)
+
+
+def via_memory(frames):
+    return pcm16_to_float32(b"".join(frames))
+
+
+def timed(fn, frames, repeat):
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(frames)
+        runs.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, nargs="+", default=[2, 10, 30, 120])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'clip (s)':>9} {'wav (ms)':>10} {'memory (ms)':>12} {'saved (ms)':>11}")
+    for seconds in args.seconds:
+        frames = make_frames(seconds)
+        wav_ms = timed(via_wav, frames, args.repeat)
+        mem_ms = timed(via_memory, frames, args.repeat)
+        print(f"{seconds:>9g} {wav_ms:>10.1f} {mem_ms:>12.2f} {wav_ms - mem_ms:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Text injection: fixed 0.3 s clipboard sleep vs confirmed paste vs typing.
+
+Runs TextInjector against MemoryInjectionBackend, so no display, clipboard or
+keyboard is needed. Each strategy is checked for correctness (the "window"
+received the text, the user's clipboard came back) and timed, for several
+simulated clipboard latencies. Past CLIPBOARD_CONFIRM_TIMEOUT the paste
+strategy gives up and the text is typed instead.
+
+Usage: python bench/bench_injection.py [--lag-ms 0 5 20 50] [--repeat 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import CyberScribe  # noqa: E402
+from CyberScribe import MemoryInjectionBackend, TextInjector  # noqa: E402
+
+SHORT = "Bonjour."
+LONG = "Ceci est une dictée plus longue, avec plusieurs phrases. " * 4
+USER_CLIPBOARD = "contenu de l'utilisateur"
+
+
+def legacy_paste(backend, text):
+    """What paste_text did before TextInjector: copy, sleep 0.3 s, Ctrl+V."""
+    backend.set_clipboard(text)
+    time.sleep(0.3)
+    backend.send_paste()
+
+
+def run(mode, text, lag, repeat):
+    timings = []
+    for _ in range(repeat):
+        backend = MemoryInjectionBackend(USER_CLIPBOARD, clipboard_lag=lag)
+        config = dict(CyberScribe.DEFAULT_CONFIG, injection_mode=mode)
+        started = time.perf_counter()
+        if mode == "legacy":
+            legacy_paste(backend, text)
+            injector = None
+        else:
+            injector = TextInjector(config, backend)
+            injector.inject(text)
+        timings.append((time.perf_counter() - started) * 1000)
+        assert backend.received == [text], (mode, lag, backend.received)
+        if mode == "paste" and lag < CyberScribe.CLIPBOARD_CONFIRM_TIMEOUT:
+            injector.flush()
+            time.sleep(lag)  # the restore write is lagged too
+            assert backend.get_clipboard() == USER_CLIPBOARD, "clipboard not restored"
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lag-ms", type=float, nargs="+", default=[0, 5, 20, 50])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    # Keep per-injection log lines out of the table
+    CyberScribe.log = CyberScribe.log_error = lambda msg: None
+
+    print(f"{'clipboard lag':>13} {'text':>5} {'legacy ms':>10} {'paste ms':>9} {'type ms':>8}")
+    for lag_ms in args.lag_ms:
+        lag = lag_ms / 1000
+        for label, text in (("short", SHORT), ("long", LONG)):
+            legacy = run("legacy", text, lag, max(1, args.repeat // 10))
+            paste = run("paste", text, lag, args.repeat)
+            typed = run("type", text, lag, args.repeat)
+            print(f"{lag_ms:>10.0f} ms {label:>5} {legacy:>10.1f} {paste:>9.1f} {typed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
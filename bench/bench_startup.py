@@ -0,0 +1,145 @@
+"""
+Cold-start timing with the GUI and audio backends stubbed (runs on Linux).
+
+Each run is a fresh interpreter that swaps tkinter, pystray, pynput, PIL,
+pyaudio, pyperclip, pyautogui and faster_whisper for inert stand-ins, imports
+CyberScribe, builds the app and drives CyberScribeApp.start_services() until
+the model is ready. The stages come from CyberScribe's own StartupTimer, so
+the numbers are the ones the app logs. numpy is real.
+
+Usage: python bench/bench_startup.py [--runs 5] [--model-load 0.0]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Stub:
+    """Accepts any call or attribute access."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __call__(self, *args, **kwargs):
+        return Stub()
+
+    def __getattr__(self, name):
+        return Stub()
+
+    def __iter__(self):
+        return iter(())
+
+
+class StubWindow(Stub):
+    def winfo_screenwidth(self):
+        return 1920
+
+    def winfo_screenheight(self):
+        return 1080
+
+
+class StubIcon(Stub):
+    def run(self, setup=None):
+        if setup:
+            setup(self)
+
+
+def install_stubs(model_load):
+    def module(name, **attrs):
+        mod = types.ModuleType(name)
+        mod.__dict__.update(attrs)
+        sys.modules[name] = mod
+        return mod
+
+    class WhisperModel:
+        def __init__(self, *args, **kwargs):
+            time.sleep(model_load)
+
+        def transcribe(self, audio, **kwargs):
+            return [], None
+
+    ttk = module("tkinter.ttk", Combobox=Stub, Scrollbar=Stub, Style=Stub)
+    messagebox = module("tkinter.messagebox", showinfo=Stub(), showwarning=Stub())
+    module(
+        "tkinter", Tk=StubWindow, Toplevel=StubWindow, Frame=Stub, Label=Stub,
+        Button=Stub, Entry=Stub, Canvas=Stub, StringVar=Stub,
+        TclError=type("TclError", (Exception,), {}), ttk=ttk, messagebox=messagebox,
+    )
+    module("pyaudio", PyAudio=Stub, paInt16=8)
+    module("pystray", Icon=StubIcon, Menu=Stub, MenuItem=Stub)
+    keyboard = module("pynput.keyboard", GlobalHotKeys=Stub, Controller=Stub, Key=Stub())
+    module("pynput", keyboard=keyboard)
+    image = module("PIL.Image", open=Stub())
+    module("PIL", Image=image)
+    module("pyautogui", hotkey=Stub())
+    module("pyperclip", copy=Stub(), paste=Stub())
+    module("faster_whisper", WhisperModel=WhisperModel)
+
+
+def redirect_runtime_files(CyberScribe, directory):
+    """Point every file the app writes next to itself at ``directory``."""
+    for name in ("CONFIG_FILE", "HARDWARE_FILE", "CALIBRATION_FILE", "LATENCY_FILE"):
+        path = getattr(CyberScribe, name)
+        setattr(CyberScribe, name, os.path.join(directory, os.path.basename(path)))
+    CyberScribe.DEBUG_AUDIO_DIR = os.path.join(directory, "debug_audio")
+    # The log file is opened on the first record (delay=True).
+    CyberScribe.LOG_HANDLER.close()
+    CyberScribe.LOG_HANDLER.baseFilename = os.path.join(directory, "debug_CyberScribe.log")
+
+
+def child(model_load):
+    install_stubs(model_load)
+    sys.path.insert(0, ROOT)
+    import CyberScribe
+
+    redirect_runtime_files(CyberScribe, tempfile.mkdtemp())
+    app = CyberScribe.CyberScribeApp()
+    app.start_services()
+    app.transcriber.loaded_event.wait()
+    deadline = time.monotonic() + 10
+    while not CyberScribe.STARTUP.reported and time.monotonic() < deadline:
+        time.sleep(0.01)
+    threading.Event().wait(0.05)
+    print(json.dumps(CyberScribe.STARTUP.stages))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--model-load", type=float, default=0.0,
+                        help="simulated WhisperModel construction time (s)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.model_load)
+        return
+
+    samples = {}
+    for _ in range(args.runs):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child",
+             "--model-load", str(args.model_load)],
+            capture_output=True, text=True, check=True,
+        )
+        stages = json.loads(out.stdout.strip().splitlines()[-1])
+        for stage, seconds in stages.items():
+            samples.setdefault(stage, []).append(seconds)
+
+    print(f"{'stage':<26} {'median (ms)':>12} {'max (ms)':>9}")
+    for stage, values in samples.items():
+        print(f"{stage:<26} {statistics.median(values) * 1000:>12.1f} {max(values) * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
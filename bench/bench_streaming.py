@@ -0,0 +1,93 @@
+"""
+Release-to-text latency vs recording length: batch vs streaming transcription.
+
+A speech clip is replayed in real time through a stand-in recorder (so the
+streaming session sees audio arrive as it would from the microphone). At
+"release" the clock starts; it stops when the final text is available:
+  batch     = Transcriber.transcribe(full clip)
+  streaming = StreamingSession.finish() (only the uncommitted tail remains)
+
+Needs the Whisper model files under models/ (or network access to fetch them).
+
+Usage: python bench/bench_streaming.py speech.wav [--lengths 5 15 30 60]
+       [--model base] [--profile fast] [--language fr]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+from faster_whisper import decode_audio  # noqa: E402
+
+from CyberScribe import DEFAULT_CONFIG, Transcriber  # noqa: E402
+
+RATE = 16000
+
+
+class ReplayRecorder:
+    """Exposes a clip as if it were being captured live, starting now."""
+
+    rate = RATE
+
+    def __init__(self, clip):
+        self.clip = clip
+        self.started = time.monotonic()
+
+    def captured_samples(self):
+        elapsed = time.monotonic() - self.started
+        return min(int(elapsed * RATE), self.clip.size)
+
+    def snapshot(self, start=0):
+        return self.clip[start:self.captured_samples()].copy()
+
+
+def fit_clip(source, seconds):
+    samples = int(seconds * RATE)
+    reps = -(-samples // source.size)
+    return np.tile(source, reps)[:samples]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("audio", help="speech recording (any format ffmpeg/av can read)")
+    parser.add_argument("--lengths", type=float, nargs="+", default=[5, 15, 30, 60])
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--profile", default="fast")
+    parser.add_argument("--language", default="fr")
+    args = parser.parse_args()
+
+    config = dict(DEFAULT_CONFIG, model_size=args.model, device="cpu",
+                  transcription_profile=args.profile, language=args.language)
+    transcriber = Transcriber(config)
+    transcriber.loaded_event.wait()
+    if not transcriber.model:
+        sys.exit("Model failed to load.")
+
+    source = decode_audio(args.audio, sampling_rate=RATE)
+    transcriber.transcribe(source[:RATE])  # first-call setup is not what we measure
+
+    print(f"{'length (s)':>10} {'batch (ms)':>11} {'streaming (ms)':>15}")
+    for seconds in args.lengths:
+        clip = fit_clip(source, seconds)
+
+        t0 = time.perf_counter()
+        transcriber.transcribe(clip)
+        batch_ms = (time.perf_counter() - t0) * 1000
+
+        recorder = ReplayRecorder(clip)
+        session = transcriber.start_stream(recorder)
+        time.sleep(seconds)
+        t0 = time.perf_counter()
+        session.close(clip.size)
+        session.finish(clip)
+        stream_ms = (time.perf_counter() - t0) * 1000
+
+        print(f"{seconds:>10g} {batch_ms:>11.0f} {stream_ms:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
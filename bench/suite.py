@@ -0,0 +1,275 @@
+"""
+Reproducible Transcriber benchmark: VALID_MODELS x CPU compute types x profiles.
+
+Fixture clips (short / medium / long speech) live in bench/fixtures/ with a
+manifest of their SHA-256, so every run decodes exactly the same audio.
+Create them once from any speech recording:
+
+    python bench/suite.py --make-fixtures meeting.wav
+
+Each (model, compute_type) pair runs in its own interpreter, offline
+(HF_HUB_OFFLINE=1, model files must already be under models/), so peak RSS
+is per configuration. Per fixture and profile the suite records load time,
+decode time and real-time factor (decode / audio), median of --repeat runs.
+
+    python bench/suite.py --out results.json
+    python bench/suite.py --models base small --profiles fast --out new.json \\
+        --compare results.json --tolerance 0.10
+
+--compare exits 1 when RTF, load time or peak RSS grows by more than the
+tolerance against the baseline for any configuration present in both.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import wave
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT, "bench", "fixtures")
+MANIFEST = os.path.join(FIXTURES_DIR, "manifest.json")
+FIXTURE_SECONDS = {"short": 3, "medium": 15, "long": 60}
+RATE = 16000
+
+sys.path.insert(0, ROOT)
+
+
+def sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def make_fixtures(source):
+    import numpy as np
+    from faster_whisper import decode_audio
+
+    audio = decode_audio(source, sampling_rate=RATE)
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    manifest = {}
+    for name, seconds in FIXTURE_SECONDS.items():
+        clip = audio[: seconds * RATE]
+        if clip.size < seconds * RATE:
+            sys.exit(f"Source is shorter than the {name} fixture ({seconds}s).")
+        path = os.path.join(FIXTURES_DIR, f"{name}.wav")
+        with wave.open(path, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(RATE)
+            wf.writeframes((np.clip(clip, -1, 1) * 32767).astype("<i2").tobytes())
+        manifest[name] = {"file": f"{name}.wav", "seconds": seconds, "sha256": sha256(path)}
+    with open(MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Wrote {len(manifest)} fixtures to {FIXTURES_DIR}")
+
+
+def load_fixtures(names):
+    import numpy as np
+
+    if not os.path.exists(MANIFEST):
+        sys.exit("No fixtures: run with --make-fixtures <speech recording> first.")
+    with open(MANIFEST, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    fixtures = {}
+    for name in names:
+        entry = manifest[name]
+        path = os.path.join(FIXTURES_DIR, entry["file"])
+        if sha256(path) != entry["sha256"]:
+            sys.exit(f"Fixture {name} does not match its manifest hash.")
+        with wave.open(path, "rb") as wf:
+            pcm = wf.readframes(wf.getnframes())
+        fixtures[name] = np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+    return fixtures
+
+
+def peak_rss_mb():
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 if sys.platform != "darwin" else peak / (1024 * 1024)
+    except ImportError:
+        from CyberScribe import process_rss_bytes
+
+        rss = process_rss_bytes()
+        return rss / (1024 * 1024) if rss else None
+
+
+def child(args):
+    """Benchmark one (model, compute_type) pair; prints JSON results."""
+    import CyberScribe
+
+    fixtures = load_fixtures(args.fixtures)
+    config = dict(
+        CyberScribe.DEFAULT_CONFIG,
+        model_size=args.models[0],
+        compute_type=args.computes[0],
+        device="cpu",
+        language=args.language,
+        silence_trim=False,
+        adaptive_decoding=False,  # measure the presets, not the clip-length strategies
+        model_cache_mb=0,
+    )
+    started = time.monotonic()
+    transcriber = CyberScribe.Transcriber(config)
+    transcriber.loaded_event.wait()
+    load_seconds = time.monotonic() - started  # includes the warm-up pass
+    if not transcriber.model:
+        print(json.dumps({"error": "model failed to load (files present under models/?)"}))
+        return
+
+    results = []
+    for profile in args.profiles:
+        config["transcription_profile"] = profile
+        for name, audio in fixtures.items():
+            runs = []
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                transcriber.transcribe(audio)
+                runs.append(time.perf_counter() - t0)
+            decode = statistics.median(runs)
+            seconds = audio.size / RATE
+            results.append({
+                "model": args.models[0],
+                "compute_type": args.computes[0],
+                "profile": profile,
+                "fixture": name,
+                "audio_seconds": seconds,
+                "load_seconds": round(load_seconds, 3),
+                "decode_seconds": round(decode, 3),
+                "rtf": round(decode / seconds, 4),
+            })
+    rss = peak_rss_mb()
+    for result in results:
+        result["peak_rss_mb"] = round(rss, 1) if rss else None
+    print(json.dumps({"results": results}))
+
+
+def cpu_compute_types():
+    from CyberScribe import VALID_COMPUTE
+
+    try:
+        import ctranslate2
+
+        return sorted(VALID_COMPUTE & set(ctranslate2.get_supported_compute_types("cpu")))
+    except Exception:
+        return ["float32", "int8"]
+
+
+def metadata():
+    meta = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+    for module in ("ctranslate2", "faster_whisper"):
+        try:
+            meta[module] = __import__(module).__version__
+        except Exception:
+            meta[module] = None
+    from CyberScribe import __version__
+
+    meta["cyberscribe"] = __version__
+    return meta
+
+
+def compare(results, baseline_path, tolerance):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    def key(r):
+        return (r["model"], r["compute_type"], r["profile"], r["fixture"])
+
+    base = {key(r): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = base.get(key(result))
+        if not old:
+            continue
+        for metric in ("rtf", "load_seconds", "peak_rss_mb"):
+            new_value, old_value = result.get(metric), old.get(metric)
+            if new_value and old_value and new_value > old_value * (1 + tolerance):
+                regressions.append(
+                    f"{'/'.join(key(result))} {metric}: {old_value} -> {new_value} "
+                    f"(+{(new_value / old_value - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main():
+    from CyberScribe import PROFILE_PRESETS, VALID_MODELS
+
+    model_order = ["tiny", "base", "small", "medium", "large-v3"]
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--models", nargs="+", default=[m for m in model_order if m in VALID_MODELS])
+    parser.add_argument("--computes", nargs="+")
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILE_PRESETS))
+    parser.add_argument("--fixtures", nargs="+", default=list(FIXTURE_SECONDS))
+    parser.add_argument("--language", default="fr")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline results JSON to check against")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    parser.add_argument("--make-fixtures", metavar="RECORDING")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.make_fixtures:
+        make_fixtures(args.make_fixtures)
+        return 0
+    if args.child:
+        child(args)
+        return 0
+
+    computes = args.computes or cpu_compute_types()
+    env = dict(os.environ, HF_HUB_OFFLINE="1")
+    results = []
+    for model in args.models:
+        for compute in computes:
+            print(f"== {model} / {compute}", file=sys.stderr)
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child",
+                 "--models", model, "--computes", compute,
+                 "--profiles", *args.profiles, "--fixtures", *args.fixtures,
+                 "--language", args.language, "--repeat", str(args.repeat)],
+                capture_output=True, text=True, env=env,
+            )
+            lines = out.stdout.strip().splitlines()
+            reply = json.loads(lines[-1]) if lines else {"error": out.stderr.strip()[-300:]}
+            if "error" in reply:
+                print(f"   skipped: {reply['error']}", file=sys.stderr)
+                continue
+            results.extend(reply["results"])
+
+    print(f"{'model':<9} {'compute':<8} {'profile':<9} {'fixture':<7} "
+          f"{'load s':>7} {'RTF':>7} {'RSS MB':>8}")
+    for r in results:
+        print(f"{r['model']:<9} {r['compute_type']:<8} {r['profile']:<9} {r['fixture']:<7} "
+              f"{r['load_seconds']:>7.2f} {r['rtf']:>7.3f} {r['peak_rss_mb'] or 0:>8.0f}")
+
+    report = {"meta": metadata(), "results": results}
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())